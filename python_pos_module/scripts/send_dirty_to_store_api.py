@@ -9,6 +9,11 @@ from typing import Any
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
 
 def _read_source_text(args: argparse.Namespace) -> str:
     if args.source_text:
@@ -44,16 +49,31 @@ def _parse_metadata_json(raw: str | None) -> dict[str, Any]:
     return value
 
 
+def _encode_json(payload: dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload)
+        except TypeError:
+            pass
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _decode_json(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def _post_json(url: str, payload: dict[str, Any], timeout_s: float) -> tuple[int, dict[str, Any]]:
     request = Request(
         url=url,
         method="POST",
         headers={"Content-Type": "application/json"},
-        data=json.dumps(payload, ensure_ascii=False).encode("utf-8"),
+        data=_encode_json(payload),
     )
     try:
         with urlopen(request, timeout=timeout_s) as response:
-            raw = response.read().decode("utf-8")
+            data = response.read()
             status_code = int(response.status)
     except HTTPError as exc:
         detail = exc.read().decode("utf-8", errors="replace")
@@ -61,7 +81,7 @@ def _post_json(url: str, payload: dict[str, Any], timeout_s: float) -> tuple[int
     except URLError as exc:
         raise RuntimeError(f"Network error: {exc}") from exc
 
-    parsed = json.loads(raw) if raw.strip() else {}
+    parsed = _decode_json(data) if data.strip() else {}
     if not isinstance(parsed, dict):
         raise RuntimeError("API response is not a JSON object")
     return status_code, parsed
@@ -1,18 +1,46 @@
 from __future__ import annotations
 
+import atexit
 import json
+import mmap
+import os
+import queue
+import re
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, BinaryIO, Iterator, Mapping
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _dumps_line(payload: Mapping[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+    return (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def _mask_value(value: Any, *, mask_text: str = "***") -> Any:
-    sensitive_keys = {
+_SENSITIVE_KEYS = frozenset(
+    {
         "password",
         "token",
         "api_key",
@@ -22,28 +50,76 @@ def _mask_value(value: Any, *, mask_text: str = "***") -> Any:
         "mobile",
         "email",
     }
+)
+_SECRET_KEY_RE = re.compile(r"token|secret")
+# 16+ chars mixing digits and letters. Only used for ASCII text, where \d and [^\W\d_] are exactly
+# str.isdigit/str.isalpha; on other text they differ (e.g. "½" is \w but not alpha, "①" is a digit but not \d).
+_CREDENTIAL_RE = re.compile(r"(?=.*\d)(?=.*[^\W\d_]).{16}", re.DOTALL)
+
+
+@lru_cache(maxsize=1024)
+def _is_sensitive_key(key: str) -> bool:
+    # Payload key names repeat heavily across events, so the decision is memoized per raw key.
+    key_l = key if key.islower() else key.lower()
+    return key_l in _SENSITIVE_KEYS or _SECRET_KEY_RE.search(key_l) is not None
+
+
+def _mask_text(value: str, mask_text: str) -> str:
+    if "@" in value and "." in value:
+        return mask_text
+    if len(value) >= 16:
+        if value.isascii():
+            if _CREDENTIAL_RE.match(value) is not None:
+                return mask_text
+        elif any(ch.isdigit() for ch in value) and any(ch.isalpha() for ch in value):
+            return mask_text
+    return value
 
-    if isinstance(value, Mapping):
-        masked: dict[str, Any] = {}
-        for key, inner in value.items():
-            key_l = str(key).lower()
-            if key_l in sensitive_keys or "token" in key_l or "secret" in key_l:
-                masked[str(key)] = mask_text
-            else:
-                masked[str(key)] = _mask_value(inner, mask_text=mask_text)
-        return masked
 
-    if isinstance(value, list):
-        return [_mask_value(item, mask_text=mask_text) for item in value]
+def _mask_value(value: Any, *, mask_text: str = "***", memo: dict[int, Any] | None = None) -> Any:
+    # Explicit stack instead of recursion: LLM payloads can be deeply nested.
+    # `memo` maps id(container) -> masked copy so shared sub-objects are walked once.
+    seen: dict[int, Any] = memo if memo is not None else {}
+    root: list[Any] = [None]
+    stack: list[tuple[Any, Any, Any]] = [(value, root, 0)]
+    while stack:
+        node, parent, slot = stack.pop()
+        if isinstance(node, str):
+            parent[slot] = _mask_text(node, mask_text)
+        elif isinstance(node, (dict, list)) or isinstance(node, Mapping):
+            cached = seen.get(id(node))
+            if cached is not None:
+                parent[slot] = cached
+            elif isinstance(node, list):
+                items: list[Any] = [None] * len(node)
+                parent[slot] = seen[id(node)] = items
+                stack.extend((item, items, index) for index, item in enumerate(node))
+            else:
+                masked: dict[str, Any] = {}
+                parent[slot] = seen[id(node)] = masked
+                for key, inner in node.items():
+                    key_text = key if type(key) is str else str(key)
+                    if _is_sensitive_key(key_text):
+                        masked[key_text] = mask_text
+                    else:
+                        masked[key_text] = None
+                        stack.append((inner, masked, key_text))
+        else:
+            parent[slot] = node
+    return root[0]
 
-    if isinstance(value, str):
-        if "@" in value and "." in value:
-            return mask_text
-        if len(value) >= 16 and any(ch.isdigit() for ch in value) and any(ch.isalpha() for ch in value):
-            return mask_text
-        return value
 
-    return value
+def _is_canonical_correction(correction: dict[str, Any], legacy_before: Any, legacy_after: Any) -> bool:
+    # Mirrors the fix-ups in AuditLogger._normalize_human_correction; True when none would apply.
+    if "before" not in correction or (correction["before"] is None and legacy_before is not None):
+        return False
+    if "after" not in correction or (correction["after"] is None and legacy_after is not None):
+        return False
+    operator_value = correction.get("operator")
+    if not isinstance(operator_value, str) or not operator_value or operator_value != operator_value.strip():
+        return False
+    timestamp_value = correction.get("timestamp")
+    return isinstance(timestamp_value, str) and bool(timestamp_value.strip())
 
 
 @dataclass(slots=True)
@@ -60,6 +136,23 @@ class AuditEventRecord:
     final_output: Any | None = None
     human_correction: dict[str, Any] | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    merge_result: Any | None = None
+    needs_review: bool = False
+
+    def validate(self) -> None:
+        if not isinstance(self.order_id, str) or not self.order_id.strip():
+            raise ValueError("audit event missing required field: order_id")
+        if not isinstance(self.event_type, str) or not self.event_type.strip():
+            raise ValueError("audit event missing required field: event_type")
+
+    def to_json_bytes(self) -> bytes:
+        # Field order matches as_dict(), so both write paths emit identical lines.
+        if orjson is not None:
+            try:
+                return orjson.dumps(self, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                pass
+        return _dumps_line(self.as_dict())[:-1]
 
     def as_dict(self) -> dict[str, Any]:
         return {
@@ -75,28 +168,156 @@ class AuditEventRecord:
             "final_output": self.final_output,
             "human_correction": self.human_correction,
             "metadata": self.metadata,
+            "merge_result": self.merge_result,
+            "needs_review": self.needs_review,
         }
 
 
+@dataclass(slots=True)
+class _ReviewState:
+    latest_event: dict[str, Any] = field(default_factory=dict)
+    latest_manual_fix: dict[str, Any] | None = None
+    pending_types: dict[Any, None] = field(default_factory=dict)
+    pending_count: int = 0
+    raw_preview: str | None = None
+
+
+_PendingLine = tuple[bytes, Any, Any, bool]
+_FileId = tuple[int, int]
+
+
+def _file_id(stat: os.stat_result) -> _FileId:
+    return (stat.st_dev, stat.st_ino)
+
+
 class AuditLogger:
-    def __init__(self, path: str | Path = "./audit.log.jsonl") -> None:
+    def __init__(
+        self,
+        path: str | Path = "./audit.log.jsonl",
+        *,
+        async_flush: bool = False,
+        batch_max: int = 64,
+        batch_ms: int = 20,
+    ) -> None:
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
-
-    def write_event(self, event: Mapping[str, Any] | AuditEventRecord, *, mask_sensitive: bool = True) -> dict[str, Any]:
-        payload = self._to_event_payload(event)
-        if mask_sensitive:
-            payload = self._mask_llm_fields(payload)
-
-        with self.path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(payload, ensure_ascii=False) + "\n")
-        return payload
+        self._handle: BinaryIO | None = None
+        # (st_dev, st_ino) of the file behind _handle, so a rotated/replaced log is detected.
+        self._handle_id: _FileId | None = None
+        self._lock = threading.Lock()
+        # Background flush: write_event enqueues encoded lines, one thread writes them in batches.
+        # The thread keeps the logger alive, so call close() (or use it as a context manager) when
+        # done; an atexit hook drains whatever is still queued if the interpreter exits first.
+        self._async_flush = async_flush
+        self._batch_max = max(1, int(batch_max))
+        self._batch_s = max(0, int(batch_ms)) / 1000.0
+        self._queue: queue.Queue[_PendingLine | None] = queue.Queue(maxsize=self._batch_max * 16)
+        self._thread: threading.Thread | None = None
+        self._flush_error: BaseException | None = None
+        # Guards _closed and queue puts, so nothing is enqueued behind close()'s sentinel. Separate from
+        # _lock because a put can block on a full queue while the flusher needs _lock to drain it.
+        self._enqueue_lock = threading.Lock()
+        self._closed = False
+        # (offset, length) of each JSONL line, keyed by order_id / event_type.
+        self._order_index: dict[str, list[tuple[int, int]]] = {}
+        self._type_index: dict[str, list[tuple[int, int]]] = {}
+        self._indexed_up_to = 0
+        self._indexed_id: _FileId | None = None
+
+    def __enter__(self) -> AuditLogger:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def flush(self) -> None:
+        # Blocks until every queued event is on disk; a no-op without async_flush.
+        if self._thread is not None:
+            self._queue.join()
+        error, self._flush_error = self._flush_error, None
+        if error is not None:
+            raise RuntimeError("audit background flush failed") from error
+
+    def close(self) -> None:
+        with self._enqueue_lock:
+            self._closed = True
+            thread = self._thread
+            if thread is not None:
+                self._queue.put(None)
+        if thread is not None:
+            thread.join()
+            self._thread = None
+            atexit.unregister(self.close)
+        leftover: list[_PendingLine] = []
+        while True:
+            try:
+                line = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if line is not None:
+                leftover.append(line)
+            self._queue.task_done()
+        if leftover:
+            self._append(leftover)
+        with self._lock:
+            handle = self._handle
+            self._handle = None
+        if handle is not None:
+            handle.close()
+
+    def write_event(
+        self,
+        event: Mapping[str, Any] | AuditEventRecord,
+        *,
+        mask_sensitive: bool = True,
+        durable: bool = False,
+    ) -> dict[str, Any]:
+        if (
+            isinstance(event, AuditEventRecord)
+            and event.human_correction is None
+            and (not mask_sensitive or (event.llm_request is None and event.llm_response is None))
+        ):
+            # Nothing to mask or normalize: serialize straight from the record's slots.
+            event.validate()
+            payload: dict[str, Any] | None = None
+            order_id, event_type = event.order_id, event.event_type
+            buf = event.to_json_bytes() + b"\n"
+        else:
+            payload = self._to_event_payload(event)
+            if mask_sensitive:
+                payload = self._mask_llm_fields(payload)
+            order_id, event_type = payload.get("order_id"), payload.get("event_type")
+            buf = _dumps_line(payload)
+
+        line = (buf, order_id, event_type, durable)
+        queued = False
+        if self._async_flush:
+            with self._enqueue_lock:
+                if not self._closed:
+                    self._start_flusher()
+                    self._queue.put(line)
+                    queued = True
+        if not queued:
+            # Synchronous logger, or an async one after close(): write in the caller's thread.
+            self._append([line])
+        elif durable:
+            # The caller asked for the line to be on disk (and fsynced) before returning.
+            self.flush()
+        return payload if payload is not None else event.as_dict()
 
     def list_events(self, order_id: str) -> list[dict[str, Any]]:
-        return [event for event in self._read_all() if event.get("order_id") == order_id]
+        self.flush()
+        with self._lock:
+            self._sync_index()
+            entries = list(self._order_index.get(order_id, ()))
+        return [event for event in self._read_at(entries) if event.get("order_id") == order_id]
 
     def list_by_type(self, event_type: str) -> list[dict[str, Any]]:
-        return [event for event in self._read_all() if event.get("event_type") == event_type]
+        self.flush()
+        with self._lock:
+            self._sync_index()
+            entries = list(self._type_index.get(event_type, ()))
+        return [event for event in self._read_at(entries) if event.get("event_type") == event_type]
 
     def get_order_trace(self, order_id: str) -> dict[str, Any]:
         events = self.list_events(order_id)
@@ -129,58 +350,60 @@ class AuditLogger:
                 trace["fallback_reason"] = fallback_reason
 
             correction = event.get("human_correction")
-            if isinstance(correction, Mapping):
+            if isinstance(correction, dict):
                 trace["manual_corrections"].append(dict(correction))
 
         return trace
 
     def list_review_queue(self, *, limit: int = 100, unresolved_only: bool = True) -> list[dict[str, Any]]:
-        by_order: dict[str, list[dict[str, Any]]] = {}
+        self.flush()
+        states: dict[str, _ReviewState] = {}
+        needs_review = self._event_needs_review
         for event in self._read_all():
             order_id = event.get("order_id")
-            if isinstance(order_id, str) and order_id:
-                by_order.setdefault(order_id, []).append(event)
+            if not isinstance(order_id, str) or not order_id:
+                continue
+            state = states.get(order_id)
+            if state is None:
+                state = states[order_id] = _ReviewState()
 
-        queue: list[dict[str, Any]] = []
-        for order_id, events in by_order.items():
-            latest_manual_fix_index = -1
-            for index, event in enumerate(events):
-                correction = event.get("human_correction")
-                if event.get("event_type") != "manual_correction":
-                    continue
-                if isinstance(correction, Mapping) and correction.get("after") is not None:
-                    latest_manual_fix_index = index
+            state.latest_event = event
+            event_type = event.get("event_type")
+            raw_text = event.get("raw_text")
+            if isinstance(raw_text, str) and raw_text.strip():
+                state.raw_preview = raw_text
 
-            pending_events: list[dict[str, Any]] = []
-            for index, event in enumerate(events):
-                if not self._event_needs_review(event):
-                    continue
-                if unresolved_only and index <= latest_manual_fix_index:
-                    continue
-                pending_events.append(event)
+            if event_type == "manual_correction":
+                correction = event.get("human_correction")
+                if isinstance(correction, dict) and correction.get("after") is not None:
+                    state.latest_manual_fix = event
+                    if unresolved_only:
+                        # Everything up to and including the fix is resolved.
+                        state.pending_types.clear()
+                        state.pending_count = 0
+                        continue
+
+            if needs_review(event):
+                state.pending_count += 1
+                if event_type:
+                    state.pending_types.setdefault(event_type, None)
 
-            if not pending_events:
+        queue: list[dict[str, Any]] = []
+        for order_id, state in states.items():
+            if not state.pending_count:
                 continue
-
-            latest_event = events[-1]
-            latest_manual_fix = events[latest_manual_fix_index] if latest_manual_fix_index >= 0 else None
-            raw_preview = None
-            for event in reversed(events):
-                value = event.get("raw_text")
-                if isinstance(value, str) and value.strip():
-                    raw_preview = value
-                    break
-
+            latest_event = state.latest_event
+            latest_manual_fix = state.latest_manual_fix
             queue.append(
                 {
                     "order_id": order_id,
                     "latest_event_type": latest_event.get("event_type"),
                     "latest_timestamp": latest_event.get("timestamp"),
-                    "pending_event_types": list(dict.fromkeys(event.get("event_type") for event in pending_events if event.get("event_type"))),
-                    "pending_count": len(pending_events),
-                    "has_manual_correction": latest_manual_fix_index >= 0,
+                    "pending_event_types": list(state.pending_types),
+                    "pending_count": state.pending_count,
+                    "has_manual_correction": latest_manual_fix is not None,
                     "latest_manual_correction": latest_manual_fix.get("human_correction") if latest_manual_fix else None,
-                    "raw_preview": raw_preview,
+                    "raw_preview": state.raw_preview,
                 }
             )
 
@@ -189,7 +412,8 @@ class AuditLogger:
         return queue[:safe_limit]
 
     def _to_event_payload(self, event: Mapping[str, Any] | AuditEventRecord) -> dict[str, Any]:
-        if isinstance(event, AuditEventRecord):
+        is_record = isinstance(event, AuditEventRecord)
+        if is_record:
             payload = event.as_dict()
         else:
             payload = dict(event)
@@ -214,16 +438,18 @@ class AuditLogger:
         payload.setdefault("metadata", {})
         payload.setdefault("needs_review", False)
 
-        payload["human_correction"] = self._normalize_human_correction(payload)
+        # Records never carry the legacy top-level correction keys, so an empty correction stays None.
+        if not is_record or payload["human_correction"] is not None:
+            payload["human_correction"] = self._normalize_human_correction(payload)
 
         return payload
 
-    def _event_needs_review(self, event: Mapping[str, Any]) -> bool:
+    def _event_needs_review(self, event: dict[str, Any]) -> bool:
         if event.get("needs_review") is True:
             return True
 
         metadata = event.get("metadata")
-        if isinstance(metadata, Mapping) and metadata.get("needs_review") is True:
+        if isinstance(metadata, dict) and metadata.get("needs_review") is True:
             return True
 
         fallback_reason = event.get("fallback_reason")
@@ -232,7 +458,7 @@ class AuditLogger:
 
         for field in ("merge_result", "final_output"):
             value = event.get(field)
-            if isinstance(value, Mapping):
+            if isinstance(value, dict):
                 if value.get("overall_needs_review") is True or value.get("needs_review") is True:
                     return True
 
@@ -257,6 +483,9 @@ class AuditLogger:
             return None
         if not isinstance(correction, Mapping):
             raise ValueError("human_correction must be an object")
+        if isinstance(correction, dict) and _is_canonical_correction(correction, legacy_before, legacy_after):
+            # Still a copy: the returned event must not alias the caller's dict.
+            return dict(correction)
 
         correction_payload = dict(correction)
         if correction_payload.get("before") is None:
@@ -276,38 +505,191 @@ class AuditLogger:
 
         return correction_payload
 
-    def _mask_llm_fields(self, payload: Mapping[str, Any]) -> dict[str, Any]:
+    def _mask_llm_fields(self, payload: dict[str, Any]) -> dict[str, Any]:
+        request = payload.get("llm_request")
+        response = payload.get("llm_response")
+        if request is None and response is None:
+            return payload
+
         masked = dict(payload)
-        masked["llm_request"] = _mask_value(masked.get("llm_request"))
-        masked["llm_response"] = _mask_value(masked.get("llm_response"))
+        memo: dict[int, Any] = {}
+        if request is not None:
+            masked["llm_request"] = _mask_value(request, memo=memo)
+        if response is not None:
+            masked["llm_response"] = _mask_value(response, memo=memo)
         return masked
 
-    def _read_all(self) -> list[dict[str, Any]]:
-        if not self.path.exists():
+    def _append(self, lines: list[_PendingLine]) -> None:
+        data = b"".join(line[0] for line in lines)
+        with self._lock:
+            handle = self._get_handle()
+            if self._handle_id != self._indexed_id:
+                self._reset_index(self._handle_id)
+            handle.write(data)
+            # Flush per call so readers (other loggers, the Node audit store) see complete lines.
+            handle.flush()
+            if any(line[3] for line in lines):
+                os.fsync(handle.fileno())
+            end = handle.tell()
+            offset = end - len(data)
+            if offset == self._indexed_up_to:
+                for buf, order_id, event_type, _ in lines:
+                    self._add_to_index(order_id, event_type, offset, len(buf))
+                    offset += len(buf)
+                self._indexed_up_to = end
+
+    def _start_flusher(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._flush_loop, name="audit-flush", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _flush_loop(self) -> None:
+        pending = self._queue
+        stopping = False
+        while not stopping:
+            first = pending.get()
+            if first is None:
+                pending.task_done()
+                return
+            batch = [first]
+            deadline = time.monotonic() + self._batch_s
+            # A durable line ends the batch: its writer is blocked in flush() until it is fsynced.
+            while len(batch) < self._batch_max and not batch[-1][3]:
+                remaining = deadline - time.monotonic()
+                try:
+                    line = pending.get(timeout=remaining) if remaining > 0 else pending.get_nowait()
+                except queue.Empty:
+                    break
+                if line is None:
+                    stopping = True
+                    break
+                batch.append(line)
+            try:
+                self._append(batch)
+            except BaseException as exc:  # surfaced to the caller by flush()
+                self._flush_error = exc
+            for _ in range(len(batch) + (1 if stopping else 0)):
+                pending.task_done()
+
+    def _get_handle(self) -> BinaryIO:
+        handle = self._handle
+        if handle is not None and not handle.closed:
+            try:
+                current_id: _FileId | None = _file_id(self.path.stat())
+            except FileNotFoundError:
+                current_id = None
+            if current_id == self._handle_id:
+                return handle
+            # The log was rotated or replaced: keep appending to whatever now lives at self.path.
+            handle.close()
+        handle = self._handle = self.path.open("ab", buffering=1 << 16)
+        self._handle_id = _file_id(os.fstat(handle.fileno()))
+        return handle
+
+    def _reset_index(self, file_id: _FileId | None) -> None:
+        self._order_index.clear()
+        self._type_index.clear()
+        self._indexed_up_to = 0
+        self._indexed_id = file_id
+
+    def _add_to_index(self, order_id: Any, event_type: Any, offset: int, length: int) -> None:
+        entry = (offset, length)
+        if isinstance(order_id, str):
+            self._order_index.setdefault(order_id, []).append(entry)
+        if isinstance(event_type, str):
+            self._type_index.setdefault(event_type, []).append(entry)
+
+    def _sync_index(self) -> None:
+        # Catch up on lines appended since the last sync, including ones written by other processes.
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            size, file_id = 0, None
+        else:
+            size, file_id = stat.st_size, _file_id(stat)
+        if file_id != self._indexed_id or size < self._indexed_up_to:
+            # Replaced (even by a file of equal or larger size) or truncated: offsets are stale.
+            self._reset_index(file_id)
+        if size == self._indexed_up_to:
+            return
+
+        indexed_up_to = self._indexed_up_to
+        for offset, line in self._iter_lines(indexed_up_to):
+            if not line.endswith(b"\n"):
+                break
+            raw = line.strip()
+            if raw:
+                try:
+                    parsed = _loads(raw)
+                except ValueError:
+                    parsed = None
+                if isinstance(parsed, dict):
+                    self._add_to_index(parsed.get("order_id"), parsed.get("event_type"), offset, len(line))
+            indexed_up_to = offset + len(line)
+        self._indexed_up_to = indexed_up_to
+
+    def _iter_lines(self, start: int = 0) -> Iterator[tuple[int, bytes]]:
+        # mmap the log and hand raw byte lines to the JSON codec (no text decoding layer).
+        try:
+            handle = self.path.open("rb")
+        except FileNotFoundError:
+            return
+        with handle:
+            if os.fstat(handle.fileno()).st_size <= start:
+                return
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mapped, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                mapped.seek(start)
+                offset = start
+                for line in iter(mapped.readline, b""):
+                    yield offset, line
+                    offset += len(line)
+
+    def _read_at(self, entries: list[tuple[int, int]]) -> list[dict[str, Any]]:
+        if not entries:
             return []
 
         events: list[dict[str, Any]] = []
-        with self.path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                raw = line.strip()
-                if not raw:
-                    continue
+        with self.path.open("rb") as handle:
+            for offset, length in entries:
+                handle.seek(offset)
                 try:
-                    parsed = json.loads(raw)
-                except json.JSONDecodeError:
+                    parsed = _loads(handle.read(length))
+                except ValueError:
                     continue
                 if isinstance(parsed, dict):
                     events.append(parsed)
         return events
 
+    def _read_all(self) -> list[dict[str, Any]]:
+        events: list[dict[str, Any]] = []
+        for _, line in self._iter_lines():
+            raw = line.strip()
+            if not raw:
+                continue
+            try:
+                parsed = _loads(raw)
+            except ValueError:
+                continue
+            if isinstance(parsed, dict):
+                events.append(parsed)
+        return events
+
 
 def write_event(
     event: Mapping[str, Any] | AuditEventRecord,
     *,
     path: str | Path = "./audit.log.jsonl",
     mask_sensitive: bool = True,
+    durable: bool = False,
 ) -> dict[str, Any]:
-    return AuditLogger(path).write_event(event, mask_sensitive=mask_sensitive)
+    with AuditLogger(path) as logger:
+        return logger.write_event(event, mask_sensitive=mask_sensitive, durable=durable)
 
 
 def list_events(order_id: str, *, path: str | Path = "./audit.log.jsonl") -> list[dict[str, Any]]:
@@ -2,9 +2,16 @@ from __future__ import annotations
 
 import hashlib
 import json
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Mapping, MutableMapping, Protocol
+from typing import Any, Iterator, Mapping, MutableMapping, Protocol
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
 
 
 ITEM_MAPPING_CACHE = "item_mapping_cache"
@@ -17,6 +24,10 @@ CACHE_NAMESPACES = {
     GROUP_PATTERN_CACHE,
 }
 
+# Bound before the module-level `set` helper below shadows the builtin.
+_SET_TYPES = (set, frozenset)
+_PRIMITIVE_TYPES = (int, float, bool, type(None))
+
 _NAMESPACE_KEY_REQUIREMENTS: dict[str, tuple[str, ...]] = {
     ITEM_MAPPING_CACHE: ("name_raw", "menu_catalog_version"),
     NOTE_MODS_CACHE: ("note_raw", "allowed_mods_version"),
@@ -24,6 +35,74 @@ _NAMESPACE_KEY_REQUIREMENTS: dict[str, tuple[str, ...]] = {
 }
 
 
+def _canonical_json(value: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def _freeze(value: Any) -> Any:
+    # Hashable view of a key payload. Scalars (mapping keys included) carry their type so 1, 1.0
+    # and True stay distinct.
+    if isinstance(value, str) or value is None:
+        return value
+    if isinstance(value, Mapping):
+        return ("map", tuple((_freeze(key), _freeze(inner)) for key, inner in value.items()))
+    if isinstance(value, (list, tuple)):
+        return ("seq", tuple(_freeze(inner) for inner in value))
+    if isinstance(value, _SET_TYPES):
+        return ("set", frozenset(_freeze(inner) for inner in value))
+    hash(value)
+    return (type(value), value)
+
+
+def _is_clean(value: Any) -> bool:
+    # True when _normalize_value would return an equal value: stripped strings,
+    # scalars, and dicts (str keys) / lists built from them.
+    stack = [value]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, str):
+            if node and (node[0].isspace() or node[-1].isspace()):
+                return False
+        elif isinstance(node, _PRIMITIVE_TYPES):
+            continue
+        elif isinstance(node, dict):
+            for key, inner in node.items():
+                if not isinstance(key, str):
+                    return False
+                stack.append(inner)
+        elif isinstance(node, list):
+            stack.extend(node)
+        else:
+            return False
+    return True
+
+
+_PLAIN_KEY_SEP = "\x1f"
+
+
+def _plain_key(namespace: str, key_payload: Mapping[str, Any]) -> str | None:
+    # Payloads holding exactly the required fields as strings (item/note/group lookups) skip
+    # canonical JSON and hashing. The unit separator never appears in the hex digest keys.
+    required_fields = _NAMESPACE_KEY_REQUIREMENTS[namespace]
+    if len(key_payload) != len(required_fields):
+        return None
+    parts: list[str] = []
+    for field_name in required_fields:
+        value = key_payload.get(field_name)
+        if not isinstance(value, str):
+            return None
+        text = value.strip()
+        if not text or _PLAIN_KEY_SEP in text:
+            return None
+        parts.append(text)
+    return f"{namespace}:{_PLAIN_KEY_SEP.join(parts)}"
+
+
 def _is_missing_required(value: Any) -> bool:
     if value is None:
         return True
@@ -74,6 +153,9 @@ class MemoryCacheBackend:
 
 
 class POSNormCache:
+    KEY_CACHE_SIZE = 4096
+    KEY_DIGEST_SIZE = 16
+
     def __init__(
         self,
         *,
@@ -81,6 +163,7 @@ class POSNormCache:
         namespace_ttls: Mapping[str, int] | None = None,
     ) -> None:
         self._backend = backend or MemoryCacheBackend()
+        self._key_cache: OrderedDict[tuple[str, Any], str] = OrderedDict()
         self._namespace_ttls = {
             ITEM_MAPPING_CACHE: 3600,
             NOTE_MODS_CACHE: 3600,
@@ -136,38 +219,121 @@ class POSNormCache:
         if namespace not in CACHE_NAMESPACES:
             raise ValueError(f"Unsupported namespace: {namespace}")
 
+        fast_key = _plain_key(namespace, key_payload)
+        if fast_key is not None:
+            return fast_key
+
+        try:
+            frozen: tuple[str, Any] | None = (namespace, _freeze(key_payload))
+        except TypeError:
+            frozen = None
+        if frozen is not None:
+            cached = self._key_cache.get(frozen)
+            if cached is not None:
+                try:
+                    self._key_cache.move_to_end(frozen)
+                except KeyError:  # pragma: no cover - evicted concurrently
+                    pass
+                return cached
+
         required_fields = _NAMESPACE_KEY_REQUIREMENTS[namespace]
         missing = [field for field in required_fields if _is_missing_required(key_payload.get(field))]
         if missing:
             raise ValueError(f"Missing key fields for {namespace}: {', '.join(missing)}")
 
         normalized_payload = self._normalize_payload(key_payload)
-        canonical = json.dumps(normalized_payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
-        digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
-        return f"{namespace}:{digest}"
+        digest = hashlib.blake2b(_canonical_json(normalized_payload), digest_size=self.KEY_DIGEST_SIZE).hexdigest()
+        key = f"{namespace}:{digest}"
+        if frozen is not None:
+            self._key_cache[frozen] = key
+            if len(self._key_cache) > self.KEY_CACHE_SIZE:
+                self._key_cache.popitem(last=False)
+        return key
 
     def _normalize_payload(self, payload: Mapping[str, Any]) -> dict[str, Any]:
+        # Key order is irrelevant here: the canonical JSON is encoded with sorted keys.
+        if all(_is_clean(value) for value in payload.values()):
+            return dict(payload)
         normalized: dict[str, Any] = {}
         for key in sorted(payload.keys()):
             normalized[key] = self._normalize_value(payload[key])
         return normalized
 
     def _normalize_value(self, value: Any) -> Any:
-        if isinstance(value, str):
-            return value.strip()
-        if isinstance(value, Mapping):
-            nested: dict[str, Any] = {}
-            for key in sorted(value.keys()):
-                nested[str(key)] = self._normalize_value(value[key])
-            return nested
-        if isinstance(value, list):
-            return [self._normalize_value(v) for v in value]
-        if isinstance(value, tuple):
-            return [self._normalize_value(v) for v in value]
-        if isinstance(value, (set, frozenset)):
-            normalized = [self._normalize_value(v) for v in value]
-            return sorted(normalized, key=lambda item: json.dumps(item, ensure_ascii=False, sort_keys=True))
-        return value
+        # Iterative walk: children are written into placeholder slots of their parent container.
+        # Sets push a sort step before their members, so it pops once every member is normalized.
+        root: list[Any] = [None]
+        stack: list[tuple[Any, Any, Any, bool]] = [(value, root, 0, False)]
+        while stack:
+            node, parent, slot, sort_members = stack.pop()
+            if sort_members:
+                try:
+                    parent[slot] = sorted(node)
+                except TypeError:
+                    # Heterogeneous or unorderable members (dicts, None, mixed types).
+                    parent[slot] = sorted(node, key=_canonical_json)
+            elif isinstance(node, str):
+                parent[slot] = node.strip()
+            elif isinstance(node, Mapping):
+                nested: dict[str, Any] = {}
+                parent[slot] = nested
+                for key in sorted(node.keys()):
+                    key_text = str(key)
+                    nested[key_text] = None
+                    stack.append((node[key], nested, key_text, False))
+            elif isinstance(node, (list, tuple)):
+                items: list[Any] = [None] * len(node)
+                parent[slot] = items
+                stack.extend((inner, items, index, False) for index, inner in enumerate(node))
+            elif isinstance(node, _SET_TYPES):
+                members: list[Any] = [None] * len(node)
+                stack.append((members, parent, slot, True))
+                stack.extend((inner, members, index, False) for index, inner in enumerate(node))
+            else:
+                parent[slot] = node
+        return root[0]
+
+
+class LLMResponseCache(MutableMapping[str, Any]):
+    # Bounded LRU with a per-entry TTL, meant for llm_normalize_and_group(response_cache=...).
+    # Locked so concurrent llm_normalize_and_group_many workers can share one instance. Expiry uses
+    # the monotonic clock, so wall-clock jumps neither keep nor drop entries early.
+    def __init__(self, *, maxsize: int = 1024, ttl_s: float | None = 1800) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self._maxsize = maxsize
+        self._ttl_s = float(ttl_s) if ttl_s is not None and ttl_s > 0 else None
+        self._entries: OrderedDict[str, tuple[Any, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: str) -> Any:
+        with self._lock:
+            value, expires_at = self._entries[key]
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._entries[key]
+                raise KeyError(key)
+            self._entries.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        expires_at = time.monotonic() + self._ttl_s if self._ttl_s is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            del self._entries[key]
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
 
 
 _default_cache = POSNormCache()
@@ -198,6 +364,7 @@ __all__ = [
     "NOTE_MODS_CACHE",
     "CacheBackend",
     "CacheEntry",
+    "LLMResponseCache",
     "MemoryCacheBackend",
     "POSNormCache",
     "get",
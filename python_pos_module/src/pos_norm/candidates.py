@@ -1,28 +1,51 @@
 from __future__ import annotations
 
-import re
+import heapq
+import string
 import unicodedata
+import zlib
+from collections import Counter
 from dataclasses import dataclass
 from difflib import SequenceMatcher
+from functools import lru_cache
 from typing import Any, Mapping, Sequence
 
 from .contracts import CandidateItem, CandidatesByLine, MenuCatalog, RawLine
 
 try:
-    from rapidfuzz import fuzz  # type: ignore
+    from rapidfuzz import fuzz, process  # type: ignore
 except Exception:  # pragma: no cover - optional dependency
     fuzz = None
+    process = None
+
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    np = None
 
 
-_COMMON_SYMBOLS_RE = re.compile(
-    r"""[!"#$%&'()*+,\-./:;<=>?@\[\]\\^_`{|}~，。！？、；：／（）【】「」『』《》〈〉·．]"""
-)
-_MULTI_SPACE_RE = re.compile(r"\s+")
+# Punctuation folded to spaces before whitespace is collapsed (one str.translate pass).
+_COMMON_SYMBOLS = string.punctuation + "，。！？、；：／（）【】「」『』《》〈〉·．"
+_SYMBOL_TABLE = str.maketrans(dict.fromkeys(_COMMON_SYMBOLS, " "))
 
 _W_CHAR = 0.50
 _W_PARTIAL = 0.30
 _W_TOKEN = 0.20
 _LOW_CONFIDENCE_THRESHOLD = 55.0
+_TEXT_CACHE_SIZE = 4096
+_BOUND_EPSILON = 1e-6
+_FINGERPRINT_MASK = 127
+
+
+@dataclass(slots=True, frozen=True)
+class _PreparedText:
+    # A name with its normalized, compact and token forms, computed once per string.
+    text: str
+    norm: str
+    compact: str
+    tokens: frozenset[str]
+    # 128-bit Bloom fingerprint of tokens: disjoint fingerprints imply disjoint token sets.
+    fingerprint: int
 
 
 @dataclass(slots=True)
@@ -30,30 +53,57 @@ class _CatalogEntry:
     item_id: str
     canonical_name: str
     aliases: list[str]
+    # Canonical name first, then aliases; built once at catalog load and indexed by the score matrix columns.
+    prepared_names: tuple[_PreparedText, ...]
 
 
+@lru_cache(maxsize=_TEXT_CACHE_SIZE)
 def _normalize_text(text: str) -> str:
-    normalized = unicodedata.normalize("NFKC", text).lower()
-    normalized = _COMMON_SYMBOLS_RE.sub(" ", normalized)
-    normalized = _MULTI_SPACE_RE.sub(" ", normalized)
-    return normalized.strip()
+    # ASCII is NFKC-stable; for other text the quick check is cheaper than a full normalize.
+    if text.isascii() or unicodedata.is_normalized("NFKC", text):
+        normalized = text.lower()
+    else:
+        normalized = unicodedata.normalize("NFKC", text).lower()
+    return " ".join(normalized.translate(_SYMBOL_TABLE).split())
 
 
 def _compact_text(text: str) -> str:
     return text.replace(" ", "")
 
 
-def _tokenize(text: str) -> set[str]:
-    normalized = _normalize_text(text)
-    compact = _compact_text(normalized)
+def _tokenize_normalized(normalized: str, compact: str) -> frozenset[str]:
     if not compact:
-        return set()
+        return frozenset()
     tokens: set[str] = {part for part in normalized.split(" ") if part}
     if len(compact) == 1:
         tokens.add(compact)
-        return tokens
+        return frozenset(tokens)
     tokens.update(compact[i : i + 2] for i in range(len(compact) - 1))
-    return tokens
+    return frozenset(tokens)
+
+
+def _token_fingerprint(tokens: frozenset[str]) -> int:
+    # crc32 rather than hash(): str hashes are salted per process, and prepared catalogs may be
+    # pickled into other processes.
+    fingerprint = 0
+    for token in tokens:
+        fingerprint |= 1 << (zlib.crc32(token.encode("utf-8")) & _FINGERPRINT_MASK)
+    return fingerprint
+
+
+# Menu names and repeated order lines recur across calls, and preparation is pure.
+@lru_cache(maxsize=_TEXT_CACHE_SIZE)
+def _prepare_text(text: str) -> _PreparedText:
+    norm = _normalize_text(text)
+    compact = _compact_text(norm)
+    tokens = _tokenize_normalized(norm, compact)
+    return _PreparedText(
+        text=text,
+        norm=norm,
+        compact=compact,
+        tokens=tokens,
+        fingerprint=_token_fingerprint(tokens),
+    )
 
 
 def _ratio(left: str, right: str) -> float:
@@ -75,46 +125,168 @@ def _partial_ratio(left: str, right: str) -> float:
         return 100.0
     if len(short) == len(long):
         return _ratio(short, long)
+    # Matching characters are capped by the multiset overlap of `short` and the window, which is
+    # maintained incrementally; windows whose cap cannot beat the best score skip SequenceMatcher.
     max_score = 0.0
     window = len(short)
+    short_counts = Counter(short)
+    window_counts: Counter[str] = Counter()
+    overlap = 0
+    for char in long[:window]:
+        if window_counts[char] < short_counts[char]:
+            overlap += 1
+        window_counts[char] += 1
     for start in range(0, len(long) - window + 1):
+        if start:
+            dropped = long[start - 1]
+            window_counts[dropped] -= 1
+            if window_counts[dropped] < short_counts[dropped]:
+                overlap -= 1
+            added = long[start + window - 1]
+            if window_counts[added] < short_counts[added]:
+                overlap += 1
+            window_counts[added] += 1
+        if 2.0 * overlap / (2 * window) * 100.0 <= max_score:
+            continue
         score = SequenceMatcher(a=short, b=long[start : start + window]).ratio() * 100.0
         if score > max_score:
             max_score = score
     return max_score
 
 
-def _token_similarity(left_tokens: set[str], right_tokens: set[str]) -> float:
+def _token_similarity(left_tokens: frozenset[str], right_tokens: frozenset[str]) -> float:
     if not left_tokens or not right_tokens:
         return 0.0
     inter = len(left_tokens & right_tokens)
-    union = len(left_tokens | right_tokens)
+    union = len(left_tokens) + len(right_tokens) - inter
     if union == 0:
         return 0.0
     return (inter / union) * 100.0
 
 
-def _score_match(query: str, candidate: str) -> tuple[float, str]:
-    query_norm = _normalize_text(query)
-    candidate_norm = _normalize_text(candidate)
-    query_compact = _compact_text(query_norm)
-    candidate_compact = _compact_text(candidate_norm)
+def _prepared_token_similarity(query: _PreparedText, candidate: _PreparedText) -> float:
+    # Most catalog names share no token with the line; the fingerprint AND rules those out
+    # without building the intersection set.
+    if not query.fingerprint & candidate.fingerprint:
+        return 0.0
+    return _token_similarity(query.tokens, candidate.tokens)
 
-    char_score = _ratio(query_compact, candidate_compact)
-    partial_score = _partial_ratio(query_compact, candidate_compact)
-    token_score = _token_similarity(_tokenize(query_norm), _tokenize(candidate_norm))
 
-    score = (_W_CHAR * char_score) + (_W_PARTIAL * partial_score) + (_W_TOKEN * token_score)
+def _substring_bonus(query: _PreparedText, candidate: _PreparedText) -> float:
+    query_compact = query.compact
+    candidate_compact = candidate.compact
     if query_compact and candidate_compact and (
         query_compact in candidate_compact or candidate_compact in query_compact
     ):
-        score += 5.0
+        return 5.0
+    return 0.0
+
+
+def _token_and_bonus(query: _PreparedText, candidate: _PreparedText) -> tuple[float, float]:
+    # The string-independent part of a pair score: token similarity and the substring bonus.
+    return _prepared_token_similarity(query, candidate), _substring_bonus(query, candidate)
+
+
+def _score_prepared(
+    query: _PreparedText,
+    candidate: _PreparedText,
+    string_score: float | None = None,
+    string_peak: float | None = None,
+    token_and_bonus: tuple[float, float] | None = None,
+) -> tuple[float, str]:
+    # string_score = weighted char + partial component, string_peak = max(char, partial);
+    # both come precombined from _batch_scores when available.
+    if string_score is None or string_peak is None:
+        char_score = _ratio(query.compact, candidate.compact)
+        partial_score = _partial_ratio(query.compact, candidate.compact)
+        string_score = (_W_CHAR * char_score) + (_W_PARTIAL * partial_score)
+        string_peak = max(char_score, partial_score)
+    token_score, bonus = token_and_bonus if token_and_bonus is not None else _token_and_bonus(query, candidate)
+
+    score = string_score + (_W_TOKEN * token_score)
+    if bonus:
+        score += bonus
 
     score = max(0.0, min(100.0, score))
-    basis = "token" if token_score >= max(char_score, partial_score) + 5.0 else "string"
+    basis = "token" if token_score >= string_peak + 5.0 else "string"
     return score, basis
 
 
+def _score_upper_bound(
+    query: _PreparedText,
+    candidate: _PreparedText,
+    token_and_bonus: tuple[float, float],
+) -> float:
+    # Upper bound of _score_prepared: ratio (Indel or SequenceMatcher) <= 2*min/(|q|+|c|),
+    # partial ratio <= 100; the token score and substring bonus are exact.
+    token_score, bonus = token_and_bonus
+    query_length = len(query.compact)
+    candidate_length = len(candidate.compact)
+    if not query_length or not candidate_length:
+        return _W_TOKEN * token_score
+    char_bound = 200.0 * min(query_length, candidate_length) / (query_length + candidate_length)
+    bound = (_W_CHAR * char_bound) + (_W_PARTIAL * 100.0) + (_W_TOKEN * token_score) + bonus
+    return min(100.0, bound)
+
+
+def _rank_key(row: tuple[float, str, str, _CatalogEntry]) -> tuple[float, str, str]:
+    return (-row[0], row[3].canonical_name, row[3].item_id)
+
+
+_BatchRows = tuple[list[float], list[float], list[float]]
+
+
+def _batch_token_scores(queries: list[_PreparedText], choices: Sequence[_PreparedText]) -> Any:
+    # Token Jaccard for every (line, name) pair: intersection sizes are one 0/1 matrix product over
+    # the lines' token vocabulary, union = |q| + |c| - intersection.
+    vocabulary: dict[str, int] = {}
+    for query in queries:
+        for token in query.tokens:
+            vocabulary.setdefault(token, len(vocabulary))
+    query_matrix = np.zeros((len(queries), max(1, len(vocabulary))), dtype=np.float64)
+    for row, query in enumerate(queries):
+        for token in query.tokens:
+            query_matrix[row, vocabulary[token]] = 1.0
+    choice_matrix = np.zeros((max(1, len(vocabulary)), len(choices)), dtype=np.float64)
+    for column, choice in enumerate(choices):
+        for token in choice.tokens:
+            index = vocabulary.get(token)
+            if index is not None:
+                choice_matrix[index, column] = 1.0
+
+    inter = query_matrix @ choice_matrix
+    query_sizes = np.array([len(query.tokens) for query in queries], dtype=np.float64)[:, None]
+    choice_sizes = np.array([len(choice.tokens) for choice in choices], dtype=np.float64)[None, :]
+    union = query_sizes + choice_sizes - inter
+    valid = (query_sizes > 0) & (choice_sizes > 0)
+    # Same operation order as _token_similarity so the scores are bit-identical.
+    return np.where(valid, (inter / np.where(valid, union, 1.0)) * 100.0, 0.0)
+
+
+def _batch_scores(queries: list[_PreparedText], choices: Sequence[_PreparedText]) -> list[_BatchRows] | None:
+    # Per line: (weighted char + partial score, max(char, partial), token score) for every catalog
+    # name. One rapidfuzz cdist call per scorer covers the whole lines x names matrix. Single-threaded
+    # (the default): an order is a few lines against one menu, where spawning a thread per core costs
+    # more than the scoring, and each ingest process already runs next to other per-order processes.
+    if fuzz is None or process is None or np is None or not queries or not choices:
+        return None
+    query_compacts = [query.compact for query in queries]
+    choice_compacts = [choice.compact for choice in choices]
+    char_matrix = process.cdist(query_compacts, choice_compacts, scorer=fuzz.ratio, dtype=np.float64)
+    partial_matrix = process.cdist(query_compacts, choice_compacts, scorer=fuzz.partial_ratio, dtype=np.float64)
+    weighted = (_W_CHAR * char_matrix) + (_W_PARTIAL * partial_matrix)
+    peak = np.maximum(char_matrix, partial_matrix)
+
+    # Match _ratio/_partial_ratio: any pair with an empty side scores 0 (rapidfuzz gives 100 for "" vs "").
+    empty_rows = np.fromiter((not query for query in query_compacts), dtype=bool, count=len(queries))
+    empty_columns = np.fromiter((not choice for choice in choice_compacts), dtype=bool, count=len(choices))
+    for matrix in (weighted, peak):
+        matrix[empty_rows, :] = 0.0
+        matrix[:, empty_columns] = 0.0
+    tokens = _batch_token_scores(queries, choices)
+    return list(zip(weighted.tolist(), peak.tolist(), tokens.tolist()))
+
+
 def _coerce_aliases(raw_aliases: Any) -> list[str]:
     if raw_aliases is None:
         return []
@@ -160,6 +332,7 @@ def _normalize_catalog_entry(item_id: Any, payload: Any) -> _CatalogEntry:
         item_id=item_id_text,
         canonical_name=canonical_name,
         aliases=aliases,
+        prepared_names=tuple(_prepare_text(name) for name in (canonical_name, *aliases)),
     )
 
 
@@ -188,59 +361,134 @@ def _as_catalog_entries(menu_catalog: Any) -> list[_CatalogEntry]:
     return entries
 
 
-def _read_line_value(line: RawLine | Mapping[str, Any], key: str, default: Any) -> Any:
-    if isinstance(line, Mapping):
-        return line.get(key, default)
-    return getattr(line, key, default)
+@dataclass(slots=True, frozen=True)
+class PreparedCatalog:
+    # Normalized, tokenized entries for one menu catalog. Build it once with prepare_catalog and pass it
+    # to generate_candidates for every order; it is a snapshot, so re-prepare after editing the menu.
+    entries: tuple[_CatalogEntry, ...]
+    choices: tuple[_PreparedText, ...]
+
+
+def prepare_catalog(menu_catalog: MenuCatalog) -> PreparedCatalog:
+    entries = tuple(_as_catalog_entries(menu_catalog))
+    choices = tuple(prepared for entry in entries for prepared in entry.prepared_names)
+    return PreparedCatalog(entries=entries, choices=choices)
+
+
+def _read_line_fields(line: RawLine | Mapping[str, Any]) -> tuple[int, str, str, int, Any, bool]:
+    # (line_index, raw_line, name_raw, qty, note_raw, needs_review) with one type dispatch per line.
+    if type(line) is RawLine:
+        line_index, raw_line, name_raw = line.line_index, line.raw_line, line.name_raw
+        qty, note_raw, needs_review = line.qty, line.note_raw, line.needs_review
+    else:
+        if isinstance(line, Mapping):
+            get = line.get
+        else:
+            def get(key: str, default: Any) -> Any:
+                return getattr(line, key, default)
+
+        line_index = get("line_index", -1)
+        raw_line = get("raw_line", "")
+        name_raw = get("name_raw", "")
+        qty = get("qty", 1)
+        note_raw = get("note_raw", None)
+        needs_review = get("needs_review", False)
+    return int(line_index), str(raw_line), str(name_raw), int(qty or 1), note_raw, bool(needs_review)
+
+
+def _select_entries(
+    query: _PreparedText,
+    entries: Sequence[_CatalogEntry],
+    limit: int,
+    batch_rows: _BatchRows | None,
+) -> list[tuple[float, str, str, _CatalogEntry]]:
+    # Scores one line against the catalog and returns its top-`limit` (score, basis, text, entry).
+    string_row, peak_row, token_row = batch_rows if batch_rows is not None else (None, None, None)
+    column = 0
+    # Without the batched matrices every pair costs a ratio + partial-ratio call, so prune
+    # names/entries whose score upper bound cannot change the top-k result.
+    prune = batch_rows is None and limit > 0
+    top_scores: list[float] = []
+
+    scored: list[tuple[float, str, str, _CatalogEntry]] = []
+    for entry in entries:
+        names = entry.prepared_names
+        pair_terms: list[tuple[float, float]] | None = None
+        bounds: list[float] | None = None
+        if prune:
+            pair_terms = [_token_and_bonus(query, name) for name in names]
+            bounds = [_score_upper_bound(query, name, terms) for name, terms in zip(names, pair_terms)]
+            if len(top_scores) >= limit and max(bounds) + _BOUND_EPSILON < top_scores[0]:
+                continue
+
+        best_score = -1.0
+        best_basis = "canonical"
+        matched_text = entry.canonical_name
+        for position, name in enumerate(names):
+            if bounds is not None and bounds[position] + _BOUND_EPSILON <= best_score:
+                continue
+            terms: tuple[float, float] | None = None
+            if pair_terms is not None:
+                terms = pair_terms[position]
+            elif token_row is not None:
+                terms = (token_row[column + position], _substring_bonus(query, name))
+            name_score, name_basis = _score_prepared(
+                query,
+                name,
+                string_row[column + position] if string_row is not None else None,
+                peak_row[column + position] if peak_row is not None else None,
+                terms,
+            )
+            if name_score > best_score:
+                best_score = name_score
+                if name_basis == "token":
+                    best_basis = "token"
+                else:
+                    best_basis = "canonical" if position == 0 else "alias"
+                matched_text = name.text
+        column += len(names)
+
+        scored.append((best_score, best_basis, matched_text, entry))
+        if prune:
+            if len(top_scores) < limit:
+                heapq.heappush(top_scores, best_score)
+            else:
+                heapq.heappushpop(top_scores, best_score)
+
+    # nsmallest == sorted(...)[:limit] (same tie-breaks) in O(M log k) for large catalogs.
+    return heapq.nsmallest(limit, scored, key=_rank_key) if limit > 0 else []
 
 
 def generate_candidates(
     lines: Sequence[RawLine],
-    menu_catalog: MenuCatalog,
+    menu_catalog: MenuCatalog | PreparedCatalog,
     top_k: int = 10,
     low_confidence_threshold: float = _LOW_CONFIDENCE_THRESHOLD,
 ) -> CandidatesByLine:
-    entries = _as_catalog_entries(menu_catalog)
+    catalog = menu_catalog if isinstance(menu_catalog, PreparedCatalog) else prepare_catalog(menu_catalog)
+    entries = catalog.entries
     limit = max(0, int(top_k))
     candidates_by_line: CandidatesByLine = {}
 
-    for line in lines:
-        line_index = int(_read_line_value(line, "line_index", -1))
-        raw_line = str(_read_line_value(line, "raw_line", ""))
-        name_raw = str(_read_line_value(line, "name_raw", ""))
-        qty = int(_read_line_value(line, "qty", 1) or 1)
-        note_raw = _read_line_value(line, "note_raw", None)
-        line_needs_review = bool(_read_line_value(line, "needs_review", False))
-
-        scored: list[tuple[float, str, str, _CatalogEntry]] = []
-        for entry in entries:
-            best_score = -1.0
-            best_basis = "canonical"
-            matched_text = entry.canonical_name
-
-            canonical_score, canonical_basis = _score_match(name_raw, entry.canonical_name)
-            if canonical_score > best_score:
-                best_score = canonical_score
-                best_basis = "token" if canonical_basis == "token" else "canonical"
-                matched_text = entry.canonical_name
-
-            for alias in entry.aliases:
-                alias_score, alias_basis = _score_match(name_raw, alias)
-                if alias_score > best_score:
-                    best_score = alias_score
-                    best_basis = "token" if alias_basis == "token" else "alias"
-                    matched_text = alias
-
-            scored.append((best_score, best_basis, matched_text, entry))
-
-        scored.sort(key=lambda row: (-row[0], row[3].canonical_name, row[3].item_id))
-        selected = scored[:limit] if limit > 0 else []
+    threshold_rounded = round(low_confidence_threshold, 4)
+    line_fields = [_read_line_fields(line) for line in lines]
+    queries = [_prepare_text(fields[2]) for fields in line_fields]
+    batch_scores = _batch_scores(queries, catalog.choices)
+
+    for line_position, (line_index, raw_line, name_raw, qty, note_raw, line_needs_review) in enumerate(line_fields):
+        query = queries[line_position]
+        selected = _select_entries(query, entries, limit, batch_scores[line_position] if batch_scores else None)
         best_line_score = selected[0][0] if selected else 0.0
         low_confidence = best_line_score < low_confidence_threshold
+        # Line-level values shared by every candidate; each candidate still owns its metadata dict
+        # because downstream stages annotate it in place.
+        best_line_score_rounded = round(best_line_score, 4)
+        review_reason = "best_score_below_threshold" if low_confidence else "ok"
+        candidate_needs_review = line_needs_review or low_confidence
 
         line_candidates: list[CandidateItem] = []
         for rank, (score, basis, matched_text, entry) in enumerate(selected, start=1):
-            review_reason = "best_score_below_threshold" if low_confidence else "ok"
+            score_rounded = round(score, 4)
             candidate = CandidateItem(
                 line_index=line_index,
                 raw_line=raw_line,
@@ -249,16 +497,16 @@ def generate_candidates(
                 candidate_name=entry.canonical_name,
                 candidate_code=entry.item_id,
                 note_raw=note_raw,
-                confidence_item=round(score, 4),
-                needs_review=line_needs_review or low_confidence,
+                confidence_item=score_rounded,
+                needs_review=candidate_needs_review,
                 metadata={
                     "match_basis": basis,
-                    "score": round(score, 4),
+                    "score": score_rounded,
                     "low_confidence": low_confidence,
                     "matched_text": matched_text,
                     "rank": rank,
-                    "best_line_score": round(best_line_score, 4),
-                    "low_confidence_threshold": round(low_confidence_threshold, 4),
+                    "best_line_score": best_line_score_rounded,
+                    "low_confidence_threshold": threshold_rounded,
                     "review_reason": review_reason,
                 },
             )
@@ -269,4 +517,4 @@ def generate_candidates(
     return candidates_by_line
 
 
-__all__ = ["generate_candidates"]
+__all__ = ["PreparedCatalog", "generate_candidates", "prepare_catalog"]
@@ -7,6 +7,7 @@ import ssl
 import urllib.error
 import urllib.request
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Mapping
 
 try:
@@ -14,6 +15,26 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     certifi = None
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _dumps(payload: Mapping[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload)
+        except TypeError:
+            pass
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 def _as_text(value: Any, fallback: str = "") -> str:
     if not isinstance(value, str):
@@ -63,6 +84,8 @@ def _is_timeout_exception(exc: Exception) -> bool:
     return "timeout" in message or "timed out" in message or "time out" in message
 
 
+# Loading the CA bundle is expensive; one context is shared by all clients.
+@lru_cache(maxsize=1)
 def _build_ssl_context() -> ssl.SSLContext:
     # Prefer certifi CA bundle on macOS/local Python builds where system CA may be missing.
     if certifi is not None:
@@ -88,7 +111,7 @@ class OpenAIChatJsonClient:
             "max_tokens": self.max_tokens,
             "response_format": {"type": "json_object"},
         }
-        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        body = _dumps(payload)
         endpoint = f"{self.base_url.rstrip('/')}/chat/completions"
         request = urllib.request.Request(
             endpoint,
@@ -104,10 +127,10 @@ class OpenAIChatJsonClient:
 
         try:
             with urllib.request.urlopen(request, timeout=timeout_value, context=ssl_context) as response:
-                raw = response.read().decode("utf-8")
+                data = response.read()
         except urllib.error.HTTPError as exc:
             try:
-                error_payload = json.loads(exc.read().decode("utf-8"))
+                error_payload = _loads(exc.read())
             except Exception:  # pragma: no cover - best-effort diagnostics
                 error_payload = None
             message = "openai chat completion failed"
@@ -130,7 +153,7 @@ class OpenAIChatJsonClient:
                 raise TimeoutError("OpenAI request timeout") from exc
             raise RuntimeError(f"OpenAI request failed: {exc}") from exc
 
-        parsed = json.loads(raw)
+        parsed = _loads(data)
         if not isinstance(parsed, Mapping):
             raise RuntimeError("OpenAI response must be a JSON object")
         choices = parsed.get("choices")
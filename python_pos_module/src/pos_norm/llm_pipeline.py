@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Mapping, Sequence
+from types import FunctionType
+from typing import Any, Callable, Iterable, Mapping, MutableMapping, Sequence
+from weakref import WeakKeyDictionary
 
 from .contracts import (
     CONTRACT_VERSION,
@@ -18,6 +24,11 @@ from .contracts import (
     StructuredResult,
 )
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
 _PROMPT_PATH = Path(__file__).resolve().parents[2] / "prompts" / "normalize_group.prompt.md"
 _GROUP_KEYWORDS = (
     "一起",
@@ -31,6 +42,10 @@ _GROUP_KEYWORDS = (
     "上面",
     "前面",
 )
+# "裝一起"/"装一起" contain "一起", so this alternation covers every pack keyword used for references.
+_PACK_KEYWORDS = ("一起", "同袋", "同包", "合併", "合并")
+_GROUP_KEYWORD_RE = re.compile("|".join(re.escape(keyword) for keyword in _GROUP_KEYWORDS))
+_PACK_KEYWORD_RE = re.compile("|".join(re.escape(keyword) for keyword in _PACK_KEYWORDS))
 _REF_COUNT_MAP = {
     "1": 1,
     "2": 2,
@@ -41,8 +56,21 @@ _REF_COUNT_MAP = {
     "两": 2,
     "三": 3,
 }
+_PROMPT_PLACEHOLDER_RE = re.compile(r"\{\{(ALLOWED_MODS_JSON|ORDER_LINES_JSON|STEP1_HINTS_JSON)\}\}")
 _REF_RE = re.compile(r"(上面|前面|前)\s*([123一二兩两三])\s*項")
-_VALID_GROUP_TYPES = {"pack_together", "separate", "other"}
+_VALID_GROUP_TYPES = frozenset({"pack_together", "separate", "other"})
+_REVIEW_FLAG_TAGS = frozenset({"policy_violation", "review_queue"})
+_TRUTHY_TEXT = frozenset({"true", "1", "yes", "y"})
+_FALSY_TEXT = frozenset({"false", "0", "no", "n"})
+_TIMEOUT_MESSAGE_RE = re.compile("timeout|timed out|time out|超時|超时")
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
+_JSON_DECODER = json.JSONDecoder()
+_MAX_LLM_TIMEOUT_S = 120.0
+_MOD_TOKEN_KEYS = ("mod", "mod_raw", "mod_name", "name")
+# Calling-convention index that last succeeded, per client function (see _call_with_optional_timeout).
+# WeakKeyDictionary is not thread-safe and llm_normalize_and_group_many calls in from worker threads.
+_CALL_STYLE_CACHE: WeakKeyDictionary[Any, int] = WeakKeyDictionary()
+_CALL_STYLE_LOCK = threading.Lock()
 _AUDIT_REASON_MAP = {
     "llm_client_missing": "fallback_llm_client_missing",
     "llm_timeout": "fallback_llm_timeout",
@@ -57,9 +85,17 @@ _AUDIT_REASON_MAP = {
 }
 
 
-def _load_prompt_template(prompt_path: str | Path | None = None) -> str:
-    path = Path(prompt_path) if prompt_path else _PROMPT_PATH
-    return path.read_text(encoding="utf-8")
+@lru_cache(maxsize=4)
+def _split_prompt_template(path: str, mtime_ns: int, size: int) -> tuple[str, ...]:
+    # Text and placeholder names alternate: (text, name, text, name, ..., text).
+    # mtime/size are part of the cache key so an edited template is re-read.
+    return tuple(_PROMPT_PLACEHOLDER_RE.split(Path(path).read_text(encoding="utf-8")))
+
+
+def _load_prompt_segments(prompt_path: str | Path | None = None) -> tuple[str, ...]:
+    path = (Path(prompt_path) if prompt_path else _PROMPT_PATH).resolve()
+    stat = path.stat()
+    return _split_prompt_template(str(path), stat.st_mtime_ns, stat.st_size)
 
 
 def _build_item_id(candidate: CandidateItem, slot: int) -> str:
@@ -67,6 +103,18 @@ def _build_item_id(candidate: CandidateItem, slot: int) -> str:
     return str(base)
 
 
+def _call_style_key(fn: Callable[..., Any]) -> Any:
+    # The key must identify the code that will run: a plain function, or the Python __call__ of a
+    # callable instance's class. Other callables (functools.partial, builtins) share a type across
+    # different wrapped functions, so they are keyed by the object itself; a TypeError from the
+    # WeakKeyDictionary (not weak-referenceable) means that callable is probed on every call.
+    func = getattr(fn, "__func__", fn)
+    if isinstance(func, FunctionType):
+        return func
+    call = getattr(type(func), "__call__", None)
+    return call if isinstance(call, FunctionType) else func
+
+
 def _call_with_optional_timeout(fn: Callable[..., Any], prompt: str, timeout_s: float) -> str:
     attempts = (
         lambda: fn(prompt=prompt, timeout_s=timeout_s),
@@ -74,33 +122,77 @@ def _call_with_optional_timeout(fn: Callable[..., Any], prompt: str, timeout_s:
         lambda: fn(prompt=prompt),
         lambda: fn(prompt),
     )
+    # Try the convention that worked last time for this client function first; on a TypeError fall
+    # back to probing the others in order (without repeating the remembered one).
+    try:
+        key = _call_style_key(fn)
+        with _CALL_STYLE_LOCK:
+            cached_style = _CALL_STYLE_CACHE.get(key)
+    except TypeError:
+        key, cached_style = None, None
+    order = list(range(len(attempts)))
+    if cached_style is not None:
+        order.remove(cached_style)
+        order.insert(0, cached_style)
+
     last_type_error: TypeError | None = None
-    for attempt in attempts:
+    for style in order:
         try:
-            response = attempt()
-            return response if isinstance(response, str) else json.dumps(response, ensure_ascii=False)
+            response = attempts[style]()
         except TypeError as exc:
             last_type_error = exc
+            continue
+        if key is not None and style != cached_style:
+            with _CALL_STYLE_LOCK:
+                _CALL_STYLE_CACHE[key] = style
+        return response if isinstance(response, str) else json.dumps(response, ensure_ascii=False)
     if last_type_error is not None:
         raise last_type_error
     raise RuntimeError("Unable to invoke llm client")
 
 
 def _invoke_llm(llm_client: Any, prompt: str, timeout_s: float) -> str:
-    if hasattr(llm_client, "complete"):
-        fn = llm_client.complete
-    elif hasattr(llm_client, "invoke"):
-        fn = llm_client.invoke
-    elif callable(llm_client):
+    # One getattr per candidate instead of hasattr + attribute access. Not cached per client:
+    # a bound method held as a WeakKeyDictionary value would keep its client alive.
+    fn = getattr(llm_client, "complete", None)
+    if fn is None:
+        fn = getattr(llm_client, "invoke", None)
+    if fn is None:
+        if not callable(llm_client):
+            raise TypeError("llm_client must be callable or implement complete()/invoke()")
         fn = llm_client
-    else:
-        raise TypeError("llm_client must be callable or implement complete()/invoke()")
     return _call_with_optional_timeout(fn, prompt=prompt, timeout_s=timeout_s)
 
 
+def _response_cache_key(llm_client: Any, prompt: str) -> str:
+    # The rendered prompt already covers template, allowed mods, lines, candidates and hints;
+    # the model name keeps entries from different models apart. Whitespace runs are collapsed
+    # so tickets that differ only in spacing share an entry.
+    model = getattr(llm_client, "model", None)
+    material = f"{model if isinstance(model, str) else ''}\x00{_WHITESPACE_RUN_RE.sub(' ', prompt)}".encode("utf-8")
+    return f"llm_response:{hashlib.blake2b(material, digest_size=16).hexdigest()}"
+
+
+def _is_cacheable_client(llm_client: Any) -> bool:
+    # Sampled responses (temperature > 0) are not reproducible, so they are never cached.
+    temperature = getattr(llm_client, "temperature", None)
+    return not isinstance(temperature, (int, float)) or temperature == 0
+
+
+def _loads_json(text: str) -> Any:
+    # orjson is strict (no NaN/Infinity, 64-bit ints, no lone surrogates); anything it rejects
+    # goes through json so accepted inputs are unchanged.
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
 def _extract_json_payload(text: str) -> Mapping[str, Any]:
     try:
-        value = json.loads(text)
+        value = _loads_json(text)
         if not isinstance(value, Mapping):
             raise ValueError("LLM output must be a JSON object")
         return value
@@ -110,7 +202,13 @@ def _extract_json_payload(text: str) -> Mapping[str, Any]:
         if start < 0 or end <= start:
             raise ValueError("LLM output is not valid JSON")
         candidate = text[start : end + 1]
-        value = json.loads(candidate)
+        try:
+            value = _loads_json(candidate)
+        except json.JSONDecodeError:
+            # raw_decode stops at the end of the first complete value, so prose or stray braces
+            # after the JSON are tolerated. Only the first "{" is tried: decoding from a later one
+            # would accept a nested item object from a truncated response instead of retrying.
+            value = _JSON_DECODER.raw_decode(text, start)[0]
         if not isinstance(value, Mapping):
             raise ValueError("LLM output must be a JSON object")
         return value
@@ -133,41 +231,38 @@ def _safe_bool(value: Any, default: bool = False) -> bool:
         return value
     if isinstance(value, str):
         normalized = value.strip().lower()
-        if normalized in {"true", "1", "yes", "y"}:
+        if normalized in _TRUTHY_TEXT:
             return True
-        if normalized in {"false", "0", "no", "n"}:
+        if normalized in _FALSY_TEXT:
             return False
     return default
 
 
 def _is_timeout_like_error(exc: Exception) -> bool:
+    # socket.timeout and asyncio.TimeoutError are aliases of TimeoutError on 3.10+.
+    if isinstance(exc, TimeoutError):
+        return True
     name = exc.__class__.__name__.lower()
     if "timeout" in name:
         return True
-    message = str(exc).lower()
-    timeout_keywords = ("timeout", "timed out", "time out", "超時", "超时")
-    return any(keyword in message for keyword in timeout_keywords)
+    return _TIMEOUT_MESSAGE_RE.search(str(exc).lower()) is not None
 
 
-def _unique_tokens(values: Sequence[str]) -> list[str]:
-    seen: set[str] = set()
-    tokens: list[str] = []
-    for value in values:
-        if not isinstance(value, str):
-            continue
-        token = value.strip()
-        if not token or token in seen:
-            continue
-        seen.add(token)
-        tokens.append(token)
-    return tokens
+def _unique_tokens(values: Iterable[Any]) -> list[str]:
+    # dict.fromkeys dedups in C while keeping first-seen order.
+    return list(dict.fromkeys(token for value in values if isinstance(value, str) and (token := value.strip())))
+
+
+def _sorted_unique_tokens(values: Iterable[Any]) -> list[str]:
+    # Callers sort anyway, so a set dedups without tracking first-seen order.
+    return sorted({token for value in values if isinstance(value, str) and (token := value.strip())})
 
 
 def _metadata_tokens(metadata: Mapping[str, Any], key: str) -> list[str]:
     raw = metadata.get(key)
     if not isinstance(raw, list):
         return []
-    return _unique_tokens([item for item in raw if isinstance(item, str)])
+    return _unique_tokens(raw)
 
 
 def _collect_review_queue_metadata(
@@ -201,54 +296,63 @@ def _collect_review_queue_metadata(
         if mapped_reason:
             reasons.append(mapped_reason)
             needs_review = True
-        if any(tag in {"policy_violation", "review_queue"} for tag in event_tags):
+        if not needs_review and not _REVIEW_FLAG_TAGS.isdisjoint(event_tags):
             needs_review = True
 
     return {
         "needs_review": needs_review,
-        "reasons": sorted(_unique_tokens(reasons)),
-        "audit_tags": sorted(_unique_tokens(tags)),
+        "reasons": _sorted_unique_tokens(reasons),
+        "audit_tags": _sorted_unique_tokens(tags),
     }
 
 
 def _extract_mod_tokens(raw_mods: Any) -> list[str]:
     if not isinstance(raw_mods, list):
         return []
+    # LLM output is almost always a plain list of strings; mixed lists take the general loop.
+    if all(type(item) is str for item in raw_mods):
+        return [token for item in raw_mods if (token := item.strip())]
     tokens: list[str] = []
     for item in raw_mods:
-        token: str | None = None
         if isinstance(item, str):
-            token = item.strip()
+            if token := item.strip():
+                tokens.append(token)
         elif isinstance(item, Mapping):
-            for key in ("mod", "mod_raw", "mod_name", "name"):
+            for key in _MOD_TOKEN_KEYS:
                 value = item.get(key)
-                if isinstance(value, str) and value.strip():
-                    token = value.strip()
+                if isinstance(value, str) and (token := value.strip()):
+                    tokens.append(token)
                     break
-        if token:
-            tokens.append(token)
     return tokens
 
 
+def _join_text(first: str | None, second: str | None) -> str:
+    # Same result as " ".join(part for part in (first, second) if part) without the generator.
+    if first and second:
+        return f"{first} {second}"
+    return first or second or ""
+
+
 def _rule_mods_from_line(line_text: str, allowed_mods: Sequence[str]) -> list[str]:
-    mods: list[str] = []
-    for mod in allowed_mods:
-        if mod and mod not in mods and mod in line_text:
-            mods.append(mod)
-    return mods
+    if not line_text:
+        return []
+    return list(dict.fromkeys(mod for mod in allowed_mods if mod and mod in line_text))
 
 
 def _resolve_reference_indices(line_positions: list[int], current_pos: int, text: str) -> list[int]:
     previous = line_positions[:current_pos]
-    matched = _REF_RE.search(text)
+    # Every _REF_RE match starts with 上 or 前; most notes have neither, so skip the regex.
+    matched = _REF_RE.search(text) if ("前" in text or "上" in text) else None
     if matched:
         count_token = matched.group(2)
         count = _REF_COUNT_MAP.get(count_token)
         if count and previous:
             return previous[-count:]
-    if ("全部" in text or "都" in text) and any(keyword in text for keyword in ("一起", "同袋", "同包", "合併", "合并")):
+    if _PACK_KEYWORD_RE.search(text) is None:
+        return []
+    if "全部" in text or "都" in text:
         return line_positions[: current_pos + 1]
-    if any(keyword in text for keyword in ("一起", "同袋", "同包", "合併", "合并", "裝一起", "装一起")) and previous:
+    if previous:
         return [previous[-1], line_positions[current_pos]]
     return []
 
@@ -257,10 +361,10 @@ def _build_step1_group_hints(order_raw: OrderRawParsed) -> list[dict[str, Any]]:
     line_positions = [line.line_index for line in order_raw.lines]
     hints: list[dict[str, Any]] = []
     for pos, line in enumerate(order_raw.lines):
-        text = " ".join(part for part in (line.note_raw, line.raw_line) if part).strip()
+        text = _join_text(line.note_raw, line.raw_line).strip()
         if not text:
             continue
-        if not any(keyword in text for keyword in _GROUP_KEYWORDS):
+        if _GROUP_KEYWORD_RE.search(text) is None:
             continue
         refs = _resolve_reference_indices(line_positions=line_positions, current_pos=pos, text=text)
         hints.append(
@@ -353,18 +457,36 @@ def _build_candidate_context(
     return item_lookup, payload
 
 
+def _prompt_json(value: Any, compact: bool) -> str:
+    # Compact JSON carries the same data in far fewer prompt tokens than indent=2. Opt-in: the prompt
+    # template's examples use indented JSON and the model has not been evaluated on compact input.
+    if not compact:
+        return json.dumps(value, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
 def _render_prompt(
     *,
-    template: str,
+    segments: Sequence[str],
     allowed_mods: Sequence[str],
     line_payload: Sequence[Mapping[str, Any]],
     step1_hints: Sequence[Mapping[str, Any]],
+    compact: bool = False,
 ) -> str:
-    prompt = template
-    prompt = prompt.replace("{{ALLOWED_MODS_JSON}}", json.dumps(list(allowed_mods), ensure_ascii=False, indent=2))
-    prompt = prompt.replace("{{ORDER_LINES_JSON}}", json.dumps(list(line_payload), ensure_ascii=False, indent=2))
-    prompt = prompt.replace("{{STEP1_HINTS_JSON}}", json.dumps(list(step1_hints), ensure_ascii=False, indent=2))
-    return prompt
+    values = {
+        "ALLOWED_MODS_JSON": _prompt_json(list(allowed_mods), compact),
+        "ORDER_LINES_JSON": _prompt_json(list(line_payload), compact),
+        "STEP1_HINTS_JSON": _prompt_json(list(step1_hints), compact),
+    }
+    parts = list(segments)
+    for index in range(1, len(parts), 2):
+        parts[index] = values[parts[index]]
+    return "".join(parts)
 
 
 def _audit(
@@ -374,13 +496,18 @@ def _audit(
     metadata: dict[str, Any] | None = None,
     tags: Sequence[str] | None = None,
 ) -> AuditEvent:
-    payload = dict(metadata or {})
-    inherited_tags = payload.get("tags")
-    merged_tags: list[str] = [event_type]
-    if isinstance(inherited_tags, list):
-        merged_tags.extend([tag for tag in inherited_tags if isinstance(tag, str)])
+    # Most sanitizer events carry no metadata, so only copy when there is something to copy.
+    # _unique_tokens drops non-str tags itself.
+    merged_tags: list[Any] = [event_type]
+    if metadata:
+        payload = dict(metadata)
+        inherited_tags = payload.get("tags")
+        if isinstance(inherited_tags, list):
+            merged_tags.extend(inherited_tags)
+    else:
+        payload = {}
     if tags:
-        merged_tags.extend([tag for tag in tags if isinstance(tag, str)])
+        merged_tags.extend(tags)
     payload["tags"] = _unique_tokens(merged_tags)
     return AuditEvent(
         event_type=event_type,
@@ -421,7 +548,7 @@ def _build_fallback_items(
             )
             review_reasons.append("missing_candidates")
             review_tags.append("missing_candidates")
-        line_text = " ".join(part for part in (line.raw_line, line.note_raw) if part)
+        line_text = _join_text(line.raw_line, line.note_raw)
         mod_tokens = _rule_mods_from_line(line_text=line_text, allowed_mods=allowed_mods)
         mods = [
             Mod(mod_raw=token, mod_name=token, confidence=0.35, needs_review=force_review)
@@ -532,7 +659,7 @@ def _sanitize_llm_items(
             line_reasons.append("missing_candidates")
             line_tags.append("missing_candidates")
 
-        line_text = " ".join(part for part in (line.raw_line, line.note_raw) if part)
+        line_text = _join_text(line.raw_line, line.note_raw)
         raw_mods = line_output.get("mods")
         invalid_mods_payload = raw_mods is not None and not isinstance(raw_mods, list)
         if invalid_mods_payload:
@@ -658,7 +785,13 @@ def _sanitize_llm_groups(
                 )
             )
             continue
-        invalid_indices = [idx for idx in raw_indices if not isinstance(idx, int) or idx not in valid_line_indices]
+        valid_indices: set[int] = set()
+        invalid_indices: list[Any] = []
+        for idx in raw_indices:
+            if isinstance(idx, int) and idx in valid_line_indices:
+                valid_indices.add(idx)
+            else:
+                invalid_indices.append(idx)
         if invalid_indices:
             audit_events.append(
                 _audit(
@@ -668,7 +801,7 @@ def _sanitize_llm_groups(
                     tags=["policy_violation", "review_queue"],
                 )
             )
-        indices = sorted({idx for idx in raw_indices if isinstance(idx, int) and idx in valid_line_indices})
+        indices = sorted(valid_indices)
         if len(indices) < 2:
             audit_events.append(
                 _audit(
@@ -744,6 +877,8 @@ def llm_normalize_and_group(
     llm_client: Any | None = None,
     timeout_s: float = 15.0,
     prompt_path: str | Path | None = None,
+    response_cache: MutableMapping[str, Any] | None = None,
+    compact_prompt_json: bool = False,
 ) -> StructuredResult:
     normalized_allowed_mods = [mod.strip() for mod in allowed_mods if isinstance(mod, str) and mod.strip()]
     step1_hints = _build_step1_group_hints(order_raw)
@@ -753,6 +888,7 @@ def llm_normalize_and_group(
     parsed_response: Mapping[str, Any] | None = None
     fallback_reason: str | None = None
     llm_attempts = 0
+    llm_cache_hit = False
     if llm_client is None:
         fallback_reason = "llm_client_missing"
         audit_events.append(
@@ -764,12 +900,13 @@ def llm_normalize_and_group(
         )
     else:
         try:
-            template = _load_prompt_template(prompt_path=prompt_path)
+            segments = _load_prompt_segments(prompt_path=prompt_path)
             prompt = _render_prompt(
-                template=template,
+                segments=segments,
                 allowed_mods=normalized_allowed_mods,
                 line_payload=line_payload,
                 step1_hints=step1_hints,
+                compact=compact_prompt_json,
             )
         except Exception as exc:
             fallback_reason = "prompt_load_error"
@@ -781,11 +918,29 @@ def llm_normalize_and_group(
                 )
             )
             prompt = ""
-        if fallback_reason is None:
+        cache_key: str | None = None
+        if fallback_reason is None and response_cache is not None and _is_cacheable_client(llm_client):
+            cache_key = _response_cache_key(llm_client, prompt)
+            cached_response = response_cache.get(cache_key)
+            if isinstance(cached_response, Mapping):
+                parsed_response = cached_response
+                llm_cache_hit = True
+                audit_events.append(
+                    _audit(
+                        "llm_cache_hit",
+                        "Reused cached LLM response for identical prompt",
+                        metadata={"cache_key": cache_key},
+                    )
+                )
+        if fallback_reason is None and parsed_response is None:
             for attempt in range(2):
                 llm_attempts = attempt + 1
                 try:
-                    raw = _invoke_llm(llm_client=llm_client, prompt=prompt, timeout_s=timeout_s)
+                    raw = _invoke_llm(
+                        llm_client=llm_client,
+                        prompt=prompt,
+                        timeout_s=min(timeout_s, _MAX_LLM_TIMEOUT_S),
+                    )
                 except TimeoutError as exc:
                     fallback_reason = "llm_timeout"
                     audit_events.append(
@@ -818,6 +973,8 @@ def llm_normalize_and_group(
                     break
                 try:
                     parsed_response = _extract_json_payload(raw)
+                    if cache_key is not None and response_cache is not None:
+                        response_cache[cache_key] = parsed_response
                     break
                 except Exception as exc:
                     if attempt == 0:
@@ -873,6 +1030,7 @@ def llm_normalize_and_group(
 
     metadata = {
         "llm_attempts": llm_attempts,
+        "llm_cache_hit": llm_cache_hit,
         "fallback_reason": fallback_reason,
         "step1_hint_count": len(step1_hints),
         "review_queue": _collect_review_queue_metadata(
@@ -891,4 +1049,37 @@ def llm_normalize_and_group(
     }
 
 
-__all__ = ["llm_normalize_and_group"]
+def llm_normalize_and_group_many(
+    orders: Sequence[tuple[OrderRawParsed, CandidatesByLine]],
+    allowed_mods: AllowedMods,
+    *,
+    llm_client: Any | None = None,
+    timeout_s: float = 15.0,
+    prompt_path: str | Path | None = None,
+    response_cache: MutableMapping[str, Any] | None = None,
+    compact_prompt_json: bool = False,
+    max_concurrency: int = 8,
+) -> list[StructuredResult]:
+    # Orders are independent and the time is spent waiting on the LLM, so overlap the requests on a
+    # thread pool; results keep the input order.
+    def run(order: tuple[OrderRawParsed, CandidatesByLine]) -> StructuredResult:
+        order_raw, candidates = order
+        return llm_normalize_and_group(
+            order_raw,
+            candidates,
+            allowed_mods,
+            llm_client=llm_client,
+            timeout_s=timeout_s,
+            prompt_path=prompt_path,
+            response_cache=response_cache,
+            compact_prompt_json=compact_prompt_json,
+        )
+
+    workers = min(max(1, int(max_concurrency)), len(orders))
+    if workers <= 1 or llm_client is None:
+        return [run(order) for order in orders]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run, orders))
+
+
+__all__ = ["llm_normalize_and_group", "llm_normalize_and_group_many"]
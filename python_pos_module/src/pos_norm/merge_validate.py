@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Mapping, Sequence
+from functools import partial
+from typing import Any, Callable, Container, Mapping, Sequence
 
 from .contracts import (
     CONTRACT_VERSION,
@@ -19,7 +20,7 @@ from .contracts import (
 )
 
 _DEFAULT_THRESHOLD = 0.85
-_VALID_GROUP_TYPES = {"pack_together", "separate", "other"}
+_VALID_GROUP_TYPES = frozenset({"pack_together", "separate", "other"})
 _ROUTE_AUTO_DISPATCH = "auto-dispatch"
 _ROUTE_REVIEW_QUEUE = "review-queue"
 
@@ -30,6 +31,20 @@ def _read(source: Any, key: str, default: Any = None) -> Any:
     return getattr(source, key, default)
 
 
+def _reader(source: Any) -> Callable[[str, Any], Any]:
+    # Resolves the Mapping/attribute branch of _read once per record instead of once per field.
+    if isinstance(source, Mapping):
+        return source.get
+    return partial(getattr, source)
+
+
+def _stripped_text(value: Any) -> str | None:
+    # Stripped string, or None for non-strings and blank strings; strips only once.
+    if not isinstance(value, str):
+        return None
+    return value.strip() or None
+
+
 def _as_dict(value: Any) -> dict[str, Any]:
     if not isinstance(value, Mapping):
         return {}
@@ -54,22 +69,23 @@ def _copy_audit_events(raw_events: Any) -> list[AuditEvent]:
         return []
     events: list[AuditEvent] = []
     for raw in raw_events:
-        event_type = _read(raw, "event_type", "")
-        message = _read(raw, "message", "")
+        read = _reader(raw)
+        event_type = read("event_type", "")
+        message = read("message", "")
         if not isinstance(event_type, str) or not event_type.strip():
             event_type = "merge_validate_info"
         if not isinstance(message, str) or not message.strip():
             message = "merge_validate_event"
-        line_index = _read(raw, "line_index", None)
-        item_index = _read(raw, "item_index", None)
+        line_index = read("line_index", None)
+        item_index = read("item_index", None)
         events.append(
             AuditEvent(
                 event_type=event_type,
                 message=message,
                 line_index=line_index if isinstance(line_index, int) else None,
                 item_index=item_index if isinstance(item_index, int) else None,
-                metadata=_as_dict(_read(raw, "metadata", {})),
-                version=str(_read(raw, "version", CONTRACT_VERSION)),
+                metadata=_as_dict(read("metadata", {})),
+                version=str(read("version", CONTRACT_VERSION)),
             )
         )
     return events
@@ -107,10 +123,14 @@ def _normalize_threshold(value: float | int | None) -> float:
 def _normalize_confidence(value: Any) -> float | None:
     if value is None:
         return None
-    try:
-        parsed = float(value)
-    except (TypeError, ValueError):
-        return None
+    # LLM JSON confidences are almost always floats already.
+    if type(value) is float:
+        parsed = value
+    else:
+        try:
+            parsed = float(value)
+        except (TypeError, ValueError):
+            return None
     if parsed < 0:
         return None
     if parsed <= 1:
@@ -120,10 +140,17 @@ def _normalize_confidence(value: Any) -> float | None:
     return None
 
 
+def _line_index_container(lines: Sequence[RawLine]) -> Container[int]:
+    # Parsers number lines 0..N-1; a range answers membership without building a hash set.
+    if all(line.line_index == position for position, line in enumerate(lines)):
+        return range(len(lines))
+    return {line.line_index for line in lines}
+
+
 def _catalog_ids(menu_catalog: MenuCatalog | None, candidates: CandidatesByLine) -> set[str]:
     ids: set[str] = set()
     if isinstance(menu_catalog, Mapping):
-        return {str(item_id).strip() for item_id in menu_catalog.keys() if str(item_id).strip()}
+        return {text for item_id in menu_catalog if (text := str(item_id).strip())}
 
     if isinstance(menu_catalog, Sequence) and not isinstance(menu_catalog, (str, bytes, bytearray)):
         for entry in menu_catalog:
@@ -166,32 +193,29 @@ def _normalize_mod(raw_mod: Any, default_confidence: float | None) -> Mod | None
             return None
         return Mod(mod_raw=token, mod_name=token, confidence=default_confidence)
 
-    token = _read(raw_mod, "mod_raw", None)
-    if not isinstance(token, str) or not token.strip():
-        token = _read(raw_mod, "mod_name", None)
-    if not isinstance(token, str) or not token.strip():
-        token = _read(raw_mod, "mod_value", None)
-    if not isinstance(token, str) or not token.strip():
+    read = _reader(raw_mod)
+    token = _stripped_text(read("mod_raw", None)) or _stripped_text(read("mod_name", None)) or _stripped_text(read("mod_value", None))
+    if token is None:
         return None
 
-    confidence = _normalize_confidence(_read(raw_mod, "confidence", None))
+    confidence = _normalize_confidence(read("confidence", None))
     if confidence is None:
         confidence = default_confidence
     return Mod(
-        mod_raw=token.strip(),
-        mod_name=_read(raw_mod, "mod_name", None),
-        mod_value=_read(raw_mod, "mod_value", None),
+        mod_raw=token,
+        mod_name=read("mod_name", None),
+        mod_value=read("mod_value", None),
         confidence=confidence,
-        needs_review=bool(_read(raw_mod, "needs_review", False)),
-        metadata=_as_dict(_read(raw_mod, "metadata", {})),
-        version=str(_read(raw_mod, "version", CONTRACT_VERSION)),
+        needs_review=bool(read("needs_review", False)),
+        metadata=_as_dict(read("metadata", {})),
+        version=str(read("version", CONTRACT_VERSION)),
     )
 
 
 def _collect_llm_items(
     raw_items: Any,
     *,
-    valid_line_indices: set[int],
+    valid_line_indices: Container[int],
     audit_events: list[AuditEvent],
 ) -> dict[int, Any]:
     if not isinstance(raw_items, list):
@@ -233,12 +257,13 @@ def _merge_one_item(
     audit_events: list[AuditEvent],
 ) -> NormalizedItem:
     needs_review = bool(line.needs_review)
-    source_metadata = _as_dict(_read(llm_item, "metadata", {})) if llm_item is not None else {}
+    read = _reader(llm_item)
+    source_metadata = _as_dict(read("metadata", {})) if llm_item is not None else {}
     primary_candidate = line_candidates[0] if line_candidates else None
 
     qty = line.qty
     if llm_item is not None:
-        llm_qty = _read(llm_item, "qty", None)
+        llm_qty = read("qty", None)
         if isinstance(llm_qty, int) and not isinstance(llm_qty, bool):
             if llm_qty > 0:
                 qty = llm_qty
@@ -273,18 +298,19 @@ def _merge_one_item(
             )
         )
 
-    confidence_item = _normalize_confidence(_read(llm_item, "confidence_item", None)) if llm_item is not None else None
-    confidence_mods = _normalize_confidence(_read(llm_item, "confidence_mods", None)) if llm_item is not None else None
+    confidence_item = _normalize_confidence(read("confidence_item", None)) if llm_item is not None else None
+    confidence_mods = _normalize_confidence(read("confidence_mods", None)) if llm_item is not None else None
 
-    if confidence_item is None or confidence_item < item_threshold:
-        needs_review = True
-    if confidence_mods is None or confidence_mods < mods_threshold:
+    # Flag-only checks: once the item is flagged they cannot change anything, so they are skipped.
+    if not needs_review and (
+        confidence_item is None
+        or confidence_item < item_threshold
+        or confidence_mods is None
+        or confidence_mods < mods_threshold
+    ):
         needs_review = True
 
-    item_code_raw = _read(llm_item, "item_code", None) if llm_item is not None else None
-    if not isinstance(item_code_raw, str) or not item_code_raw.strip():
-        item_code_raw = _read(llm_item, "item_id", None) if llm_item is not None else None
-    item_code = item_code_raw.strip() if isinstance(item_code_raw, str) and item_code_raw.strip() else None
+    item_code = (_stripped_text(read("item_code", None)) or _stripped_text(read("item_id", None))) if llm_item is not None else None
     item_code_is_valid = item_code is not None and item_code in valid_catalog_ids
     if item_code is not None and not item_code_is_valid:
         needs_review = True
@@ -327,7 +353,7 @@ def _merge_one_item(
                 )
             )
 
-    name_normalized_raw = _read(llm_item, "name_normalized", None) if llm_item is not None else None
+    name_normalized_raw = read("name_normalized", None) if llm_item is not None else None
     name_normalized = name_normalized_raw if isinstance(name_normalized_raw, str) and name_normalized_raw.strip() else None
     if name_normalized is None and selected_candidate is not None:
         name_normalized = selected_candidate.candidate_name
@@ -339,7 +365,7 @@ def _merge_one_item(
         needs_review = True
         fallback_reason = fallback_reason or "name_from_raw"
 
-    raw_mods = _read(llm_item, "mods", []) if llm_item is not None else []
+    raw_mods = read("mods", []) if llm_item is not None else []
     if not isinstance(raw_mods, list):
         raw_mods = []
         needs_review = True
@@ -361,19 +387,11 @@ def _merge_one_item(
             rejected_mods.append(normalized_mod.mod_raw)
             needs_review = True
             continue
+        # _normalize_mod always returns a fresh Mod with its own metadata dict, so flag it in place.
         mod_conf = normalized_mod.confidence
-        mod_conf_low = mod_conf is None or mod_conf < mods_threshold
-        mods.append(
-            Mod(
-                mod_raw=normalized_mod.mod_raw,
-                mod_name=normalized_mod.mod_name,
-                mod_value=normalized_mod.mod_value,
-                confidence=mod_conf,
-                needs_review=normalized_mod.needs_review or mod_conf_low,
-                metadata=dict(normalized_mod.metadata),
-                version=normalized_mod.version,
-            )
-        )
+        if mod_conf is None or mod_conf < mods_threshold:
+            normalized_mod.needs_review = True
+        mods.append(normalized_mod)
     if rejected_mods:
         audit_events.append(
             _audit(
@@ -384,7 +402,6 @@ def _merge_one_item(
             )
         )
 
-    llm_item_needs_review = bool(_read(llm_item, "needs_review", False)) if llm_item is not None else True
     if llm_item is None:
         needs_review = True
         fallback_reason = fallback_reason or "llm_item_missing"
@@ -395,7 +412,7 @@ def _merge_one_item(
                 line_index=line.line_index,
             )
         )
-    if llm_item_needs_review:
+    if not needs_review and read("needs_review", False):
         needs_review = True
 
     item_metadata = dict(source_metadata)
@@ -415,19 +432,19 @@ def _merge_one_item(
         item_code=item_code,
         note_raw=line.note_raw,
         mods=mods,
-        group_id=_read(llm_item, "group_id", None) if llm_item is not None else None,
+        group_id=read("group_id", None) if llm_item is not None else None,
         confidence_item=confidence_item,
         confidence_mods=confidence_mods,
         needs_review=needs_review,
         metadata=item_metadata,
-        version=str(_read(llm_item, "version", CONTRACT_VERSION)) if llm_item is not None else CONTRACT_VERSION,
+        version=str(read("version", CONTRACT_VERSION)) if llm_item is not None else CONTRACT_VERSION,
     )
 
 
 def _merge_groups(
     raw_groups: Any,
     *,
-    valid_line_indices: set[int],
+    valid_line_indices: Container[int],
     group_threshold: float,
     audit_events: list[AuditEvent],
 ) -> list[GroupResult]:
@@ -438,20 +455,22 @@ def _merge_groups(
     occupied: dict[int, str] = {}
 
     for idx, raw in enumerate(raw_groups):
-        group_id_raw = _read(raw, "group_id", None)
+        read = _reader(raw)
+        group_id_raw = read("group_id", None)
         group_id = group_id_raw if isinstance(group_id_raw, str) and group_id_raw.strip() else f"G{idx + 1}"
-        group_type_raw = _read(raw, "type", "other")
+        group_type_raw = read("type", "other")
         group_type = group_type_raw if isinstance(group_type_raw, str) and group_type_raw in _VALID_GROUP_TYPES else "other"
-        label_raw = _read(raw, "label", None)
+        label_raw = read("label", None)
         label = label_raw if isinstance(label_raw, str) and label_raw.strip() else "group"
 
-        raw_indices_value = _read(raw, "line_indices", [])
+        raw_indices_value = read("line_indices", [])
         invalid_indices_shape = not isinstance(raw_indices_value, list)
         raw_indices = raw_indices_value if isinstance(raw_indices_value, list) else []
         seen_local: set[int] = set()
-        cleaned: list[int] = []
         out_of_range_found = False
         duplicated_found = False
+        conflict_found = False
+        final_indices: list[int] = []
         for line_index in raw_indices:
             if not isinstance(line_index, int):
                 out_of_range_found = True
@@ -463,22 +482,17 @@ def _merge_groups(
                 duplicated_found = True
                 continue
             seen_local.add(line_index)
-            cleaned.append(line_index)
-
-        conflict_found = False
-        final_indices: list[int] = []
-        for line_index in cleaned:
             if line_index in occupied:
                 conflict_found = True
                 continue
             occupied[line_index] = group_id
             final_indices.append(line_index)
 
-        confidence_group = _normalize_confidence(_read(raw, "confidence_group", None))
+        confidence_group = _normalize_confidence(read("confidence_group", None))
         low_confidence = confidence_group is None or confidence_group < group_threshold
         too_few_lines = len(final_indices) < 2
         needs_review = (
-            bool(_read(raw, "needs_review", False))
+            bool(read("needs_review", False))
             or invalid_indices_shape
             or out_of_range_found
             or duplicated_found
@@ -540,9 +554,9 @@ def _merge_groups(
                 metadata={
                     "source": "llm",
                     "group_membership_rule": "single_group_per_line_first_wins",
-                    **_as_dict(_read(raw, "metadata", {})),
+                    **_as_dict(read("metadata", {})),
                 },
-                version=str(_read(raw, "version", CONTRACT_VERSION)),
+                version=str(read("version", CONTRACT_VERSION)),
             )
         )
 
@@ -556,16 +570,23 @@ def _build_dispatch_decision(
     groups: Sequence[GroupResult],
     overall_needs_review: bool,
 ) -> dict[str, Any]:
+    # One pass over items collects all three per-item flags.
+    item_needs_review = missing_item_code = invalid_qty = False
+    for item in items:
+        item_needs_review = item_needs_review or item.needs_review
+        missing_item_code = missing_item_code or item.item_code is None
+        invalid_qty = invalid_qty or not isinstance(item.qty, int) or item.qty <= 0
+
     reasons: list[str] = []
     if order_raw.needs_review:
         reasons.append("order_raw_needs_review")
-    if any(item.needs_review for item in items):
+    if item_needs_review:
         reasons.append("item_needs_review")
     if any(group.needs_review for group in groups):
         reasons.append("group_needs_review")
-    if any(item.item_code is None for item in items):
+    if missing_item_code:
         reasons.append("missing_item_code")
-    if any(not isinstance(item.qty, int) or item.qty <= 0 for item in items):
+    if invalid_qty:
         reasons.append("invalid_qty")
 
     should_review = overall_needs_review or bool(reasons)
@@ -593,10 +614,10 @@ def merge_and_validate(
     normalized_group_threshold = _normalize_threshold(group_threshold)
 
     copied_lines = [_copy_raw_line(line) for line in order_raw.lines]
-    valid_line_indices = {line.line_index for line in copied_lines}
+    valid_line_indices = _line_index_container(copied_lines)
     valid_catalog_ids = _catalog_ids(menu_catalog, candidates)
     allowed_mods_set = (
-        {mod.strip() for mod in allowed_mods if isinstance(mod, str) and mod.strip()}
+        {token for mod in allowed_mods if (token := _stripped_text(mod))}
         if allowed_mods is not None
         else None
     )
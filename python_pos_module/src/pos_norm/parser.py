@@ -4,25 +4,27 @@ import re
 
 from .contracts import OrderRawParsed, RawLine
 
-_SYMBOL_MAP = str.maketrans(
-    {
-        "：": ":",
-        "（": "(",
-        "）": ")",
-        "＊": "*",
-        "﹡": "*",
-        "＄": "$",
-        "Ｘ": "x",
-        "ｘ": "x",
-        "×": "x",
-        "　": " ",
-    }
+# Folded with a str.replace chain: for a handful of single characters this is faster than
+# str.translate, which maps the line character by character.
+# No replacement produces another key, so the order does not matter.
+_SYMBOL_FOLDS = (
+    ("：", ":"),
+    ("（", "("),
+    ("）", ")"),
+    ("＊", "*"),
+    ("﹡", "*"),
+    ("＄", "$"),
+    ("Ｘ", "x"),
+    ("ｘ", "x"),
+    ("×", "x"),
+    ("　", " "),
 )
 
+# One or more list markers ("1.", "(2)", "*", "a)", ...) with their trailing spaces, so a single
+# sub strips them all.
 _LEADING_MARKER_RE = re.compile(
-    r"^\s*(?:[*\-•●#]+|\d{1,3}[.)、]|[(（]\d{1,3}[)）]|[A-Za-z][.)])\s*"
+    r"^\s*(?:(?:[*\-•●#]+|\d{1,3}[.)、]|[(（]\d{1,3}[)）]|[A-Za-z][.)])\s*)+"
 )
-_SEPARATOR_RE = re.compile(r"^[\-=~_*#\s]{3,}$")
 _PHONE_ONLY_RE = re.compile(
     r"^\s*(?:電話|tel)?\s*:?\s*(?:\+?886[-\s]?)?"
     r"(?:0\d{1,2}[-\s]?\d{6,8}|09\d{2}[-\s]?\d{3}[-\s]?\d{3})"
@@ -42,6 +44,8 @@ _QTY_FEN_ANY_RE = re.compile(r"^(?P<name>.+?)\s+(?P<qty_text>\S+)\s*份\s*$")
 _HAS_QTY_HINT_RE = re.compile(r"[x*]\s*\S+|\d+\s*份", re.IGNORECASE)
 _HAS_QTY_MARKER_RE = re.compile(r"(?:^|\s)[x*]\s*\S+", re.IGNORECASE)
 _HAS_FEN_MARKER_RE = re.compile(r"\d+\s*份")
+_FALLBACK_QTY_MARKER_RE = re.compile(r"[x*]\s*-?\d+\s*$", re.IGNORECASE)
+_FALLBACK_QTY_TAIL_RE = re.compile(r"\s*-?\d+\s*份?\s*$")
 _TRAILING_CURRENCY_AMOUNT_RE = re.compile(
     r"^(?P<body>.+?)\s*(?:ntd?\$?|twd|\$)\s*(?P<amount>\d+(?:\.\d{1,2})?)\s*$",
     re.IGNORECASE,
@@ -52,37 +56,64 @@ _NOISE_PREFIX_RE = re.compile(
     r"^\s*(?:電話|tel|地址|統編|單號|訂單|時間|日期|總計|小計|合計|應收|找零)(?:\s|:|$)",
     re.IGNORECASE,
 )
+# Separator rules ("-----", "=== ===") are made only of these symbols plus whitespace.
+_SEPARATOR_CHARS = "-=~_*#"
+# One match per line instead of up to three: alternatives are tried in the same order as the
+# individual checks used to run, and lastgroup tells which one hit.
+_NOISE_LINE_RE = re.compile(
+    "|".join(
+        f"(?P<{name}>{pattern.pattern})"
+        for name, pattern in (
+            ("prefix", _NOISE_PREFIX_RE),
+            ("phone", _PHONE_ONLY_RE),
+            ("datetime", _DATETIME_ONLY_RE),
+        )
+    ),
+    re.IGNORECASE,
+)
+# Every _NOISE_LINE_RE alternative can only start with one of these (or a digit/space): the first
+# character of a noise prefix (tel matches T/t only) and phone-number leaders.
+_NOISE_LEAD_CHARS = frozenset("電地統單訂時日總小合應找Tt:+")
+
+
+def _fold_symbols(line: str) -> str:
+    for symbol, replacement in _SYMBOL_FOLDS:
+        if symbol in line:
+            line = line.replace(symbol, replacement)
+    return line
 
 
 def _normalize_for_parse(line: str) -> str:
-    normalized = line.translate(_SYMBOL_MAP)
-    normalized = re.sub(r"\s+", " ", normalized)
-    return normalized.strip()
+    # str.split() splits on the same Unicode whitespace as \s and drops the ends, so this
+    # collapses runs and strips in one C-level pass.
+    return " ".join(_fold_symbols(line).split())
 
 
 def _strip_leading_markers(line: str) -> str:
-    current = line
-    while True:
-        stripped = _LEADING_MARKER_RE.sub("", current, count=1).strip()
-        if stripped == current:
-            return current
-        current = stripped
+    return _LEADING_MARKER_RE.sub("", line, count=1).strip()
+
+
+def _is_separator_line(line: str) -> bool:
+    # Same as ^[-=~_*#\s]{3,}$ without the regex VM: drop whitespace, then strip the symbols.
+    return len(line) >= 3 and not "".join(line.split()).strip(_SEPARATOR_CHARS)
 
 
 def _is_noise_line(normalized_line: str) -> bool:
     if not normalized_line:
         return True
-    if _SEPARATOR_RE.match(normalized_line):
-        return True
-    if _NOISE_PREFIX_RE.match(normalized_line):
-        if _HAS_QTY_HINT_RE.search(normalized_line):
-            return False
+    if _is_separator_line(normalized_line):
         return True
-    if _PHONE_ONLY_RE.match(normalized_line):
-        return True
-    if _DATETIME_ONLY_RE.match(normalized_line):
-        return True
-    return False
+    # Item lines usually start with a dish name, which rules out every noise pattern cheaply.
+    first = normalized_line[0]
+    if first not in _NOISE_LEAD_CHARS and not first.isdigit() and not first.isspace():
+        return False
+    matched = _NOISE_LINE_RE.match(normalized_line)
+    if matched is None:
+        return False
+    if matched.lastgroup == "prefix":
+        # Prefix-looking lines that still carry a qty hint are items, not noise.
+        return _HAS_QTY_HINT_RE.search(normalized_line) is None
+    return True
 
 
 def _extract_inline_note(text: str) -> tuple[str, str | None]:
@@ -104,31 +135,40 @@ def _extract_parenthetical_note(name_with_note: str) -> tuple[str, list[str]]:
 
 
 def _fallback_name(text: str) -> str:
-    name = re.sub(r"[x*]\s*-?\d+\s*$", "", text, flags=re.IGNORECASE).strip()
-    name = re.sub(r"\s*-?\d+\s*份?\s*$", "", name).strip()
+    name = _FALLBACK_QTY_MARKER_RE.sub("", text).strip()
+    name = _FALLBACK_QTY_TAIL_RE.sub("", name).strip()
     return name or text.strip()
 
 
 def _extract_name_and_qty_once(text: str) -> tuple[str, int | None, str]:
-    x_or_star = _QTY_X_OR_STAR_RE.match(text)
-    if x_or_star:
-        return x_or_star.group("name").strip(), int(x_or_star.group("qty")), "ok"
-
-    fen = _QTY_FEN_RE.match(text)
-    if fen:
-        return fen.group("name").strip(), int(fen.group("qty")), "ok"
-
-    marker_match = _QTY_MARKER_ANY_RE.match(text)
-    if marker_match:
-        qty_text = marker_match.group("qty_text").strip()
-        state = "missing" if not qty_text else "invalid"
-        return marker_match.group("name").strip(), None, state
-
-    fen_match = _QTY_FEN_ANY_RE.match(text)
-    if fen_match:
-        return fen_match.group("name").strip(), None, "invalid"
-
-    if _HAS_QTY_MARKER_RE.search(text) or _HAS_FEN_MARKER_RE.search(text):
+    # Every marker pattern needs an x/* and every 份 pattern needs 份, so lines without them
+    # (most item lines) go straight to the plain-number check. Pattern priority is unchanged.
+    has_marker = "x" in text or "X" in text or "*" in text
+    has_fen = "份" in text
+
+    if has_marker:
+        x_or_star = _QTY_X_OR_STAR_RE.match(text)
+        if x_or_star:
+            return x_or_star.group("name").strip(), int(x_or_star.group("qty")), "ok"
+
+    if has_fen:
+        fen = _QTY_FEN_RE.match(text)
+        if fen:
+            return fen.group("name").strip(), int(fen.group("qty")), "ok"
+
+    if has_marker:
+        marker_match = _QTY_MARKER_ANY_RE.match(text)
+        if marker_match:
+            qty_text = marker_match.group("qty_text").strip()
+            state = "missing" if not qty_text else "invalid"
+            return marker_match.group("name").strip(), None, state
+
+    if has_fen:
+        fen_match = _QTY_FEN_ANY_RE.match(text)
+        if fen_match:
+            return fen_match.group("name").strip(), None, "invalid"
+
+    if (has_marker and _HAS_QTY_MARKER_RE.search(text)) or (has_fen and _HAS_FEN_MARKER_RE.search(text)):
         return text, None, "invalid"
 
     plain = _QTY_PLAIN_RE.match(text)
@@ -168,8 +208,9 @@ def _extract_name_and_qty(prepared: str) -> tuple[str, int | None, str]:
     return name_raw, qty, state
 
 
-def _parse_line(raw_line: str, line_index: int, warnings: list[str]) -> RawLine:
-    normalized = _normalize_for_parse(raw_line)
+def _parse_line(raw_line: str, line_index: int, warnings: list[str], normalized: str | None = None) -> RawLine:
+    if normalized is None:
+        normalized = _normalize_for_parse(raw_line)
     prepared = _strip_leading_markers(normalized)
     prepared, inline_note = _extract_inline_note(prepared)
 
@@ -220,7 +261,7 @@ def parse_receipt_text(text: str) -> OrderRawParsed:
         if not normalized or _is_noise_line(normalized):
             continue
         try:
-            parsed = _parse_line(raw_line=raw_line, line_index=index, warnings=parse_warnings)
+            parsed = _parse_line(raw_line=raw_line, line_index=index, warnings=parse_warnings, normalized=normalized)
             lines.append(parsed)
         except Exception as exc:  # pragma: no cover - defensive branch
             parse_errors.append(f"line {index}: {exc}")
@@ -229,7 +270,7 @@ def parse_receipt_text(text: str) -> OrderRawParsed:
                 RawLine(
                     line_index=index,
                     raw_line=raw_line,
-                    name_raw=_normalize_for_parse(raw_line) or raw_line.strip(),
+                    name_raw=normalized or raw_line.strip(),
                     qty=1,
                     note_raw=None,
                     needs_review=True,
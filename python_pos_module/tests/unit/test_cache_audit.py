@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import json
+import subprocess
 import sys
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
@@ -10,12 +12,14 @@ import pytest
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
+import pos_norm.audit as audit_module  # noqa: E402
 import pos_norm.cache as cache_module  # noqa: E402
-from pos_norm.audit import AuditLogger  # noqa: E402
+from pos_norm.audit import AuditEventRecord, AuditLogger  # noqa: E402
 from pos_norm.cache import (  # noqa: E402
     GROUP_PATTERN_CACHE,
     ITEM_MAPPING_CACHE,
     NOTE_MODS_CACHE,
+    LLMResponseCache,
     POSNormCache,
 )
 
@@ -115,6 +119,22 @@ def test_cache_ttl_zero_means_no_expiry(monkeypatch) -> None:  # type: ignore[no
     assert cache.get(ITEM_MAPPING_CACHE, key) is not None
 
 
+def test_llm_response_cache_evicts_lru_and_expires(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    base_time = 5000.0
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: base_time)
+    cache = LLMResponseCache(maxsize=2, ttl_s=10)
+    cache["a"] = {"items": []}
+    cache["b"] = {"items": []}
+    assert cache.get("a") == {"items": []}
+    cache["c"] = {"items": []}
+    assert sorted(cache) == ["a", "c"]
+
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: base_time + 10)
+    assert cache.get("a") is None
+    assert "c" not in cache
+    assert len(cache) == 0
+
+
 def test_cache_version_change_invalidates_lookup() -> None:
     cache = POSNormCache()
     cache.set(
@@ -265,6 +285,84 @@ def test_cache_invalidate_removes_entry() -> None:
     assert cache.get(NOTE_MODS_CACHE, key) is None
 
 
+def test_cache_key_memo_is_bounded_and_type_aware(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setattr(POSNormCache, "KEY_CACHE_SIZE", 2)
+    cache = POSNormCache()
+    base = {"name_raw": "酸辣湯", "menu_catalog_version": "menu-v1", "store_id": "store-daan"}
+
+    first = cache._make_key(ITEM_MAPPING_CACHE, base)
+    assert cache._make_key(ITEM_MAPPING_CACHE, dict(base)) == first
+    assert cache._make_key(ITEM_MAPPING_CACHE, {**base, "name_raw": " 酸辣湯 "}) == first
+    assert cache._make_key(ITEM_MAPPING_CACHE, {**base, "size": 1}) != cache._make_key(
+        ITEM_MAPPING_CACHE, {**base, "size": True}
+    )
+    assert len(cache._key_cache) == 2
+
+    assert len(first) == len(f"{ITEM_MAPPING_CACHE}:") + POSNormCache.KEY_DIGEST_SIZE * 2
+
+    unhashable = {**base, "extra": [{"a": {1, 2}}]}
+    assert cache._make_key(ITEM_MAPPING_CACHE, unhashable) == cache._make_key(ITEM_MAPPING_CACHE, dict(unhashable))
+
+
+def test_cache_key_memo_distinguishes_int_bool_and_float_mapping_keys() -> None:
+    cache = POSNormCache()
+    base = {"name_raw": "酸辣湯", "menu_catalog_version": "menu-v1"}
+    payloads = [{**base, "extra": {key: "a"}} for key in (1, True, 1.0)]
+
+    keys = [cache._make_key(ITEM_MAPPING_CACHE, payload) for payload in payloads]
+
+    assert keys == [POSNormCache()._make_key(ITEM_MAPPING_CACHE, payload) for payload in payloads]
+    assert len(set(keys)) == 3
+
+
+def test_cache_plain_string_payloads_use_concatenated_key() -> None:
+    cache = POSNormCache()
+    key = cache._make_key(ITEM_MAPPING_CACHE, {"name_raw": " 酸辣湯", "menu_catalog_version": "menu-v1 "})
+
+    assert key == f"{ITEM_MAPPING_CACHE}:酸辣湯\x1fmenu-v1"
+    assert cache._key_cache == {}
+    assert cache._make_key(ITEM_MAPPING_CACHE, {"name_raw": "a\x1fb", "menu_catalog_version": "c"}) != cache._make_key(
+        ITEM_MAPPING_CACHE, {"name_raw": "a", "menu_catalog_version": "b\x1fc"}
+    )
+    with pytest.raises(ValueError, match="name_raw"):
+        cache._make_key(ITEM_MAPPING_CACHE, {"name_raw": " ", "menu_catalog_version": "menu-v1"})
+
+    cache.set(NOTE_MODS_CACHE, {"note_raw": "加辣", "allowed_mods_version": "mods-v1"}, value=["加辣"], confidence=0.9)
+    assert cache.get(NOTE_MODS_CACHE, {"allowed_mods_version": "mods-v1", "note_raw": " 加辣 "}) is not None
+
+
+def test_cache_normalize_payload_fast_path_matches_slow_path() -> None:
+    cache = POSNormCache()
+    clean = {"name_raw": "酸辣湯", "menu_catalog_version": "menu-v1", "qty": 2, "tags": ["a", {"b": None}]}
+    dirty = {"name_raw": "酸辣湯 ", "menu_catalog_version": "menu-v1", "qty": 2, "tags": ("a", {"b": None})}
+
+    assert cache._normalize_payload(clean) == clean
+    assert cache._normalize_payload(dirty) == clean
+    assert cache._normalize_payload({"nested": {1: "x"}}) == {"nested": {"1": "x"}}
+    assert cache._normalize_value(({" a ": [" b", {"c ", "a"}]},)) == [{" a ": ["b", ["a", "c"]]}]
+
+    deep: object = " leaf "
+    for _ in range(5000):
+        deep = [deep]
+    assert cache._normalize_value(deep) is not None
+    assert cache._make_key(ITEM_MAPPING_CACHE, clean) == cache._make_key(ITEM_MAPPING_CACHE, dirty)
+
+
+def test_cache_set_values_normalize_to_stable_order() -> None:
+    cache = POSNormCache()
+
+    assert cache._normalize_value({" b", "a", "c"}) == ["a", "b", "c"]
+    assert cache._normalize_value(frozenset({3, 1, 2})) == [1, 2, 3]
+    mixed = cache._normalize_value({"a", 1, None, ("x",)})
+    assert sorted(map(repr, mixed)) == sorted(map(repr, ["a", 1, None, ["x"]]))
+    assert cache._normalize_value({"a", 1, None, ("x",)}) == mixed
+
+    key = {"note_raw": "加辣", "allowed_mods_version": "mods-v1"}
+    assert cache._make_key(NOTE_MODS_CACHE, {**key, "mods": {"加辣", "去醬", 1}}) == cache._make_key(
+        NOTE_MODS_CACHE, {**key, "mods": {1, "去醬", "加辣"}}
+    )
+
+
 def test_audit_write_read_order_and_list_by_type(tmp_path: Path) -> None:
     logger = AuditLogger(tmp_path / "audit.jsonl")
 
@@ -398,6 +496,71 @@ def test_audit_human_correction_defaults_operator_and_timestamp(tmp_path: Path)
     assert correction["timestamp"].strip() != ""
 
 
+def test_audit_record_events_keep_or_normalize_human_correction(tmp_path: Path) -> None:
+    logger = AuditLogger(tmp_path / "audit.jsonl")
+    canonical = {
+        "before": {"item_id": "I001"},
+        "after": {"item_id": "I003"},
+        "operator": "alice",
+        "timestamp": "2026-02-14T12:00:00+00:00",
+    }
+
+    plain = logger.write_event(AuditEventRecord(order_id="ORD-REC-1", event_type="parse"))
+    kept = logger.write_event(
+        AuditEventRecord(order_id="ORD-REC-1", event_type="manual_correction", human_correction=dict(canonical))
+    )
+    fixed = logger.write_event(
+        AuditEventRecord(
+            order_id="ORD-REC-1",
+            event_type="manual_correction",
+            human_correction={"after": {"item_id": "I003"}, "operator": " bob "},
+        )
+    )
+
+    assert plain["human_correction"] is None
+    assert kept["human_correction"] == canonical
+    mapping_kept = logger.write_event(
+        {"order_id": "ORD-REC-1", "event_type": "manual_correction", "human_correction": canonical}
+    )
+    assert mapping_kept["human_correction"] == canonical
+    assert mapping_kept["human_correction"] is not canonical
+    assert fixed["human_correction"]["before"] is None
+    assert fixed["human_correction"]["operator"] == "bob"
+    assert fixed["human_correction"]["timestamp"]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_audit_record_fast_path_writes_same_line_as_mapping_path(
+    monkeypatch,  # type: ignore[no-untyped-def]
+    tmp_path: Path,
+    use_orjson: bool,
+) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(audit_module, "orjson", None)
+    record = AuditEventRecord(
+        order_id="ORD-FAST-1",
+        event_type="candidate_generation",
+        timestamp="2026-02-14T10:00:00+00:00",
+        candidates={0: [{"item_id": "I001"}]},
+        metadata={"stage": "candidates"},
+    )
+    fast_logger = AuditLogger(tmp_path / "fast.jsonl")
+    slow_logger = AuditLogger(tmp_path / "slow.jsonl")
+
+    returned = fast_logger.write_event(record, mask_sensitive=False)
+    slow_logger.write_event(record.as_dict(), mask_sensitive=True)
+
+    fast_line = (tmp_path / "fast.jsonl").read_text(encoding="utf-8")
+    slow_line = (tmp_path / "slow.jsonl").read_text(encoding="utf-8")
+    assert json.loads(fast_line) == json.loads(slow_line)
+    assert list(json.loads(fast_line)) == list(json.loads(slow_line))
+    assert returned == record.as_dict()
+    assert fast_logger.list_events("ORD-FAST-1")[0]["candidates"] == {"0": [{"item_id": "I001"}]}
+
+    with pytest.raises(ValueError, match="order_id"):
+        fast_logger.write_event(AuditEventRecord(order_id=" ", event_type="parse"), mask_sensitive=False)
+
+
 def test_audit_order_trace_covers_pipeline_stages(tmp_path: Path) -> None:
     logger = AuditLogger(tmp_path / "audit.jsonl")
     logger.write_event(
@@ -535,6 +698,172 @@ def test_audit_review_queue_with_dispatch_and_review_decision(tmp_path: Path) ->
     assert any(item["order_id"] == "ORD-Q-3" for item in all_rows)
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_audit_roundtrip_with_and_without_orjson(
+    monkeypatch,  # type: ignore[no-untyped-def]
+    tmp_path: Path,
+    use_orjson: bool,
+) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(audit_module, "orjson", None)
+    logger = AuditLogger(tmp_path / "audit.jsonl")
+    logger.write_event(
+        {
+            "order_id": "ORD-CODEC-1",
+            "event_type": "candidate_generation",
+            "raw_text": "招牌鍋貼 x2",
+            "candidates": {0: [{"item_id": "I001", "score": 97.5}]},
+        }
+    )
+
+    raw = (tmp_path / "audit.jsonl").read_text(encoding="utf-8")
+    assert raw.endswith("\n")
+    assert "招牌鍋貼" in raw
+
+    event = logger.list_events("ORD-CODEC-1")[0]
+    assert event["raw_text"] == "招牌鍋貼 x2"
+    assert event["candidates"] == {"0": [{"item_id": "I001", "score": 97.5}]}
+
+
+def test_audit_logger_reuses_append_handle_until_closed(tmp_path: Path) -> None:
+    path = tmp_path / "audit.jsonl"
+    with AuditLogger(path) as logger:
+        logger.write_event({"order_id": "ORD-H-1", "event_type": "parse"})
+        handle = logger._handle
+        logger.write_event({"order_id": "ORD-H-1", "event_type": "merge_validate"}, durable=True)
+
+        assert handle is not None
+        assert logger._handle is handle
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+        assert [event["event_type"] for event in AuditLogger(path).list_events("ORD-H-1")] == ["parse", "merge_validate"]
+
+    assert logger._handle is None
+    assert handle.closed
+
+    logger.write_event({"order_id": "ORD-H-1", "event_type": "manual_correction"})
+    assert len(logger.list_events("ORD-H-1")) == 3
+    logger.close()
+
+
+def test_audit_async_flush_batches_writes_in_order(tmp_path: Path) -> None:
+    path = tmp_path / "audit.jsonl"
+    logger = AuditLogger(path, async_flush=True, batch_max=8, batch_ms=5)
+    for index in range(50):
+        logger.write_event({"order_id": "ORD-ASYNC-1", "event_type": f"step_{index}"})
+    logger.write_event({"order_id": "ORD-ASYNC-2", "event_type": "parse", "needs_review": True})
+
+    assert [event["event_type"] for event in logger.list_events("ORD-ASYNC-1")] == [f"step_{i}" for i in range(50)]
+    assert [item["order_id"] for item in logger.list_review_queue()] == ["ORD-ASYNC-2"]
+
+    logger.write_event({"order_id": "ORD-ASYNC-2", "event_type": "dispatch_decision"}, durable=True)
+    logger.close()
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 52
+    assert logger._thread is None
+
+
+def test_audit_async_durable_write_is_on_disk_when_it_returns(tmp_path: Path) -> None:
+    path = tmp_path / "audit.jsonl"
+    logger = AuditLogger(path, async_flush=True, batch_ms=10_000)
+    logger.write_event({"order_id": "ORD-DUR-1", "event_type": "parse"})
+    logger.write_event({"order_id": "ORD-DUR-1", "event_type": "dispatch_decision"}, durable=True)
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["event_type"] for line in lines] == ["parse", "dispatch_decision"]
+    logger.close()
+
+
+def test_audit_async_writes_after_close_are_written_synchronously(tmp_path: Path) -> None:
+    path = tmp_path / "audit.jsonl"
+    logger = AuditLogger(path, async_flush=True)
+    logger.write_event({"order_id": "ORD-CLOSE-1", "event_type": "parse"})
+    logger.close()
+    logger.write_event({"order_id": "ORD-CLOSE-1", "event_type": "late"})
+
+    assert logger._thread is None
+    assert [event["event_type"] for event in logger.list_events("ORD-CLOSE-1")] == ["parse", "late"]
+    logger.close()
+
+
+def test_audit_async_flush_drains_queue_at_interpreter_exit(tmp_path: Path) -> None:
+    path = tmp_path / "audit.jsonl"
+    script = (
+        "import sys\n"
+        f"sys.path.insert(0, {str(PROJECT_ROOT / 'src')!r})\n"
+        "from pos_norm.audit import AuditLogger\n"
+        f"logger = AuditLogger({str(path)!r}, async_flush=True, batch_ms=10_000)\n"
+        "for index in range(20):\n"
+        "    logger.write_event({'order_id': 'ORD-EXIT-1', 'event_type': f'step_{index}'})\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True, timeout=30)
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["event_type"] for line in lines] == [f"step_{i}" for i in range(20)]
+
+
+def test_audit_index_picks_up_lines_appended_by_other_writers(tmp_path: Path) -> None:
+    path = tmp_path / "audit.jsonl"
+    logger = AuditLogger(path)
+    logger.write_event({"order_id": "ORD-IDX-1", "event_type": "parse"})
+    assert [event["event_type"] for event in logger.list_events("ORD-IDX-1")] == ["parse"]
+
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps({"order_id": "ORD-IDX-1", "event_type": "dispatch_decision"}) + "\n")
+        handle.write("not-json\n")
+        handle.write(json.dumps({"order_id": "ORD-IDX-2", "event_type": "parse"}) + "\n")
+
+    logger.write_event({"order_id": "ORD-IDX-1", "event_type": "manual_correction"})
+
+    assert [event["event_type"] for event in logger.list_events("ORD-IDX-1")] == [
+        "parse",
+        "dispatch_decision",
+        "manual_correction",
+    ]
+    assert [event["order_id"] for event in logger.list_by_type("parse")] == ["ORD-IDX-1", "ORD-IDX-2"]
+    assert logger.list_events("ORD-MISSING") == []
+
+    logger.close()
+    path.write_text("", encoding="utf-8")
+    assert logger.list_events("ORD-IDX-1") == []
+
+
+def test_audit_follows_a_rotated_or_replaced_log_file(tmp_path: Path) -> None:
+    import os
+
+    path = tmp_path / "audit.jsonl"
+    logger = AuditLogger(path)
+    logger.write_event({"order_id": "ORD-ROT-1", "event_type": "parse"})
+    assert [event["event_type"] for event in logger.list_events("ORD-ROT-1")] == ["parse"]
+    old_size = path.stat().st_size
+
+    replacement = tmp_path / "replacement.jsonl"
+    line = json.dumps({"order_id": "ORD-ROT-2", "event_type": "parse"})
+    replacement.write_text(line.ljust(old_size - 1) + "\n", encoding="utf-8")
+    assert replacement.stat().st_size == old_size
+    os.replace(path, tmp_path / "audit.jsonl.1")
+    os.replace(replacement, path)
+
+    assert logger.list_events("ORD-ROT-1") == []
+    assert [event["order_id"] for event in logger.list_by_type("parse")] == ["ORD-ROT-2"]
+
+    logger.write_event({"order_id": "ORD-ROT-1", "event_type": "dispatch_decision"})
+    assert [event["event_type"] for event in logger.list_events("ORD-ROT-1")] == ["dispatch_decision"]
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+    assert len((tmp_path / "audit.jsonl.1").read_text(encoding="utf-8").splitlines()) == 1
+    logger.close()
+
+
+def test_audit_review_queue_reads_empty_missing_and_unterminated_logs(tmp_path: Path) -> None:
+    path = tmp_path / "audit.jsonl"
+    logger = AuditLogger(path)
+    assert logger.list_review_queue() == []
+
+    path.write_bytes(b"")
+    assert logger.list_review_queue() == []
+
+    path.write_bytes(b'\n{"order_id": "ORD-M-1", "event_type": "ingest_pipeline", "needs_review": true}')
+    assert [item["order_id"] for item in logger.list_review_queue()] == ["ORD-M-1"]
+
+
 def test_audit_masks_sensitive_fields_in_llm_payload(tmp_path: Path) -> None:
     logger = AuditLogger(tmp_path / "audit.jsonl")
 
@@ -561,6 +890,67 @@ def test_audit_masks_sensitive_fields_in_llm_payload(tmp_path: Path) -> None:
     assert event["llm_response"]["result"]["item_id"] == "I001"
 
 
+def test_mask_value_handles_nested_payloads_and_credential_strings() -> None:
+    payload = {
+        "messages": [{"role": "user", "content": "招牌鍋貼 x2"}, {"Client_Secret": "abc"}],
+        "Authorization": "Bearer x",
+        "session_token_id": 1,
+        "trace": "a1b2c3d4e5f6g7h8",
+        "short": "a1b2",
+        "digits_only": "1234567890123456",
+        "zh": "招牌鍋貼招牌鍋貼招牌鍋貼招牌鍋貼2",
+        "nested": {"level": [{"email": "x"}, 3, None, ["ok"]]},
+    }
+
+    masked = audit_module._mask_value(payload)
+
+    assert list(masked.keys()) == list(payload.keys())
+    assert masked["messages"] == [{"role": "user", "content": "招牌鍋貼 x2"}, {"Client_Secret": "***"}]
+    assert masked["Authorization"] == "***"
+    assert masked["session_token_id"] == "***"
+    assert masked["trace"] == "***"
+    assert masked["short"] == "a1b2"
+    assert masked["digits_only"] == "1234567890123456"
+    assert masked["zh"] == "***"
+    assert masked["nested"] == {"level": [{"email": "***"}, 3, None, ["ok"]]}
+    assert audit_module._mask_value(None) is None
+    assert audit_module._mask_value(MappingProxyType({"api_key": "x", "ok": 1})) == {"api_key": "***", "ok": 1}
+
+    deep: object = "leaf"
+    for _ in range(5000):
+        deep = [deep]
+    assert audit_module._mask_value(deep) is not None
+
+
+def test_credential_masking_agrees_with_isdigit_isalpha_on_non_ascii_text() -> None:
+    samples = [
+        "½½½½½½½½1111111111",  # "½" is a word character but not alpha
+        "①①①①①①①①abcdefgh",  # "①" is a digit but not \d
+        "²²²²²²²²鍋貼鍋貼鍋貼鍋貼",
+        "٣٣٣٣٣٣٣٣酸辣湯酸辣湯酸辣",
+        "招牌鍋貼招牌鍋貼招牌鍋貼招牌鍋貼",
+        "ａｂｃｄ１２３４ａｂｃｄ１２３４",
+        "a1b2c3d4e5f6g7h8",
+        "________________1a",
+    ]
+    for value in samples:
+        expected = any(ch.isdigit() for ch in value) and any(ch.isalpha() for ch in value)
+        assert (audit_module._mask_text(value, "***") == "***") is expected, value
+
+
+def test_audit_mask_llm_fields_skips_absent_fields_and_shares_masked_subtrees(tmp_path: Path) -> None:
+    logger = AuditLogger(tmp_path / "audit.jsonl")
+    plain = {"order_id": "ORD-M-2", "llm_request": None, "llm_response": None}
+    assert logger._mask_llm_fields(plain) is plain
+
+    shared = {"token": "abc", "items": ["ok"]}
+    masked = logger._mask_llm_fields({"llm_request": {"a": shared, "b": shared}, "llm_response": shared})
+    assert masked["llm_request"]["a"] == {"token": "***", "items": ["ok"]}
+    assert masked["llm_request"]["a"] is masked["llm_request"]["b"]
+    assert masked["llm_response"] is masked["llm_request"]["a"]
+    assert shared["token"] == "abc"
+
+
 def test_fixtures_cover_required_scenarios() -> None:
     menu_catalog = json.loads((PROJECT_ROOT / "fixtures" / "menu_catalog.json").read_text(encoding="utf-8"))
     allowed_mods = json.loads((PROJECT_ROOT / "fixtures" / "allowed_mods.json").read_text(encoding="utf-8"))
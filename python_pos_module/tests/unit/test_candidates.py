@@ -7,7 +7,8 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
-from pos_norm.candidates import generate_candidates  # noqa: E402
+import pos_norm.candidates as candidates_module  # noqa: E402
+from pos_norm.candidates import generate_candidates, prepare_catalog  # noqa: E402
 from pos_norm.contracts import RawLine  # noqa: E402
 
 
@@ -216,3 +217,129 @@ def test_dict_payload_non_sequence_value_does_not_break_ingest() -> None:
     result = generate_candidates([_line(22, "酸辣湯")], dict_catalog, top_k=5)
     assert result[22]
     assert all((candidate.candidate_code or "").strip() for candidate in result[22])
+
+
+def test_batched_scoring_matches_pairwise_scoring(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    lines = [_line(23, "咖哩雞肉鍋貼"), _line(24, "  酸辣   湯 ！！！  "), _line(25, ""), _line(26, "鍋")]
+    catalog = {**MENU_CATALOG_DICT_SHAPE, "I007": {"canonical_name": "!!!", "aliases": ["豆漿"]}}
+    batched = generate_candidates(lines, catalog, top_k=10)
+
+    monkeypatch.setattr(candidates_module, "np", None)
+    pairwise = generate_candidates(lines, catalog, top_k=10)
+
+    assert batched == pairwise
+
+
+def test_text_preparation_is_memoized_and_immutable() -> None:
+    first = candidates_module._prepare_text("咖哩雞肉鍋貼")
+    second = candidates_module._prepare_text("咖哩雞肉鍋貼")
+
+    assert first is second
+    assert isinstance(first.tokens, frozenset)
+    assert candidates_module._prepare_text("酸辣 湯").tokens == frozenset({"酸辣", "湯", "辣湯"})
+
+
+def test_normalize_text_handles_ascii_normalized_and_fullwidth_input() -> None:
+    assert candidates_module._normalize_text("Hot-Soup  (L)") == "hot soup l"
+    assert candidates_module._normalize_text("酸辣湯(小)") == "酸辣湯 小"
+    assert candidates_module._normalize_text("Ｃｏｆｆｅｅ　２") == "coffee 2"
+
+
+def test_upper_bound_pruning_keeps_top_k_unchanged(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    lines = [_line(27, "咖哩雞肉鍋貼"), _line(28, "酸辣湯(小)"), _line(29, "奶茶"), _line(30, "豆")]
+    catalog = {
+        **MENU_CATALOG_DICT_SHAPE,
+        "I007": {"canonical_name": "豆漿", "aliases": ["無糖豆漿", "冰豆漿大杯"]},
+        "I008": {"canonical_name": "紅茶", "aliases": ["古早味紅茶"]},
+        "I009": {"canonical_name": "蔥油餅加蛋", "aliases": []},
+    }
+    monkeypatch.setattr(candidates_module, "np", None)
+    pruned = generate_candidates(lines, catalog, top_k=2)
+
+    monkeypatch.setattr(candidates_module, "_score_upper_bound", lambda query, candidate, terms: 100.0)
+    exhaustive = generate_candidates(lines, catalog, top_k=2)
+
+    assert pruned == exhaustive
+
+
+def test_token_fingerprint_shortcut_matches_exact_similarity() -> None:
+    names = ["咖哩雞肉鍋貼", "酸辣湯", "珍珠奶茶", "hot soup", "豆", ""]
+    for left in names:
+        for right in names:
+            query = candidates_module._prepare_text(left)
+            candidate = candidates_module._prepare_text(right)
+            expected = candidates_module._token_similarity(query.tokens, candidate.tokens)
+            assert candidates_module._prepared_token_similarity(query, candidate) == expected
+            if query.tokens & candidate.tokens:
+                assert query.fingerprint & candidate.fingerprint
+
+
+def test_token_fingerprint_is_stable_across_processes() -> None:
+    import os
+    import subprocess
+
+    script = (
+        "import sys\n"
+        f"sys.path.insert(0, {str(PROJECT_ROOT / 'src')!r})\n"
+        "from pos_norm.candidates import _prepare_text\n"
+        "print(_prepare_text('咖哩雞肉鍋貼 hot soup').fingerprint)\n"
+    )
+    env = {**os.environ, "PYTHONHASHSEED": "12345"}
+    completed = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True)
+    assert int(completed.stdout) == candidates_module._prepare_text("咖哩雞肉鍋貼 hot soup").fingerprint
+
+
+def test_mapping_and_object_lines_match_rawline_input() -> None:
+    class _LineObject:
+        line_index = 31
+        raw_line = "酸辣湯 x2"
+        name_raw = "酸辣湯"
+        qty = 2
+
+    raw_line = RawLine(line_index=31, raw_line="酸辣湯 x2", name_raw="酸辣湯", qty=2)
+    raw = generate_candidates([raw_line], MENU_CATALOG, top_k=3)
+    mapping = generate_candidates(
+        [{"line_index": 31, "raw_line": "酸辣湯 x2", "name_raw": "酸辣湯", "qty": 2}], MENU_CATALOG, top_k=3
+    )
+    obj = generate_candidates([_LineObject()], MENU_CATALOG, top_k=3)  # type: ignore[list-item]
+
+    assert raw == mapping == obj
+
+
+def test_pure_python_partial_ratio_window_pruning_matches_exhaustive_scan(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    from difflib import SequenceMatcher
+
+    monkeypatch.setattr(candidates_module, "fuzz", None)
+    pairs = [("湯麵", "牛肉湯餃麵"), ("abc", "xxbxcaxbc"), ("酸辣", "辣酸湯辣"), ("aab", "babab"), ("奶茶", "紅豆餅")]
+    for short, long in pairs:
+        expected = max(
+            SequenceMatcher(a=short, b=long[start : start + len(short)]).ratio() * 100.0
+            for start in range(len(long) - len(short) + 1)
+        )
+        if short in long:
+            expected = 100.0
+        assert candidates_module._partial_ratio(short, long) == expected
+
+
+def test_prepared_catalog_matches_raw_catalog_and_is_a_snapshot() -> None:
+    catalog = {key: dict(value) for key, value in MENU_CATALOG_DICT_SHAPE.items()}
+    prepared = prepare_catalog(catalog)
+    lines = [_line(32, "玉米湯"), _line(33, "咖哩雞肉鍋貼")]
+    assert generate_candidates(lines, prepared, top_k=3) == generate_candidates(lines, catalog, top_k=3)
+
+    catalog["I004"]["aliases"] = ["玉米湯"]
+    assert generate_candidates([_line(32, "玉米湯")], catalog, top_k=1)[32][0].metadata["matched_text"] == "玉米湯"
+    stale = generate_candidates([_line(32, "玉米湯")], prepared, top_k=1)[32][0]
+    assert stale.metadata["matched_text"] != "玉米湯"
+    refreshed = generate_candidates([_line(32, "玉米湯")], prepare_catalog(catalog), top_k=1)[32][0]
+    assert refreshed.candidate_code == "I004"
+    assert refreshed.metadata["matched_text"] == "玉米湯"
+
+
+def test_batched_token_scores_match_pairwise_jaccard() -> None:
+    queries = [candidates_module._prepare_text(text) for text in ("咖哩 雞肉鍋貼", "", "hot soup l", "豆")]
+    choices = [candidates_module._prepare_text(text) for text in ("咖哩鍋貼", "!!!", "Hot Soup", "豆漿", "")]
+    matrix = candidates_module._batch_token_scores(queries, choices).tolist()
+    for row, query in enumerate(queries):
+        for column, choice in enumerate(choices):
+            assert matrix[row][column] == candidates_module._token_similarity(query.tokens, choice.tokens)
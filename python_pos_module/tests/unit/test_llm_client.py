@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import json
 import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
+import pytest
+
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
-from pos_norm.llm_client import build_llm_client_from_env  # noqa: E402
+import pos_norm.llm_client as llm_client_module  # noqa: E402
+from pos_norm.llm_client import OpenAIChatJsonClient, build_llm_client_from_env  # noqa: E402
 
 
 def test_build_llm_client_from_env_returns_none_without_key() -> None:
@@ -52,3 +58,80 @@ def test_build_llm_client_from_env_builds_openai_client_with_key() -> None:
     assert runtime["model"] == "gpt-4o-mini"
     assert runtime["timeout_s_default"] == 7.5
 
+
+def _clear_proxy_env(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    for name in ("http_proxy", "https_proxy", "all_proxy", "no_proxy"):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.upper(), raising=False)
+
+
+class _ChatHandler(BaseHTTPRequestHandler):
+    request_paths: list[str] = []
+
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers.get("Content-Length") or 0)
+        request = json.loads(self.rfile.read(length))
+        self.request_paths.append(self.path)
+        if request["messages"][0]["content"] == "fail":
+            status, payload = 429, {"error": {"message": "rate limited"}}
+        else:
+            status, payload = 200, {"choices": [{"message": {"content": '{"ok": true}'}}]}
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        return
+
+
+def test_openai_client_posts_chat_request_and_maps_http_errors(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    _clear_proxy_env(monkeypatch)
+    _ChatHandler.request_paths = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ChatHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_port}/v1"
+    try:
+        client = OpenAIChatJsonClient(api_key="sk-test", model="m", base_url=base_url)
+        assert client.complete("hi", timeout_s=5) == '{"ok": true}'
+        with pytest.raises(RuntimeError, match="OpenAI HTTP 429: rate limited"):
+            client.complete("fail", timeout_s=5)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert _ChatHandler.request_paths == ["/v1/chat/completions", "/v1/chat/completions"]
+
+
+def test_openai_client_routes_through_configured_http_proxy(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    _clear_proxy_env(monkeypatch)
+    _ChatHandler.request_paths = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ChatHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("HTTP_PROXY", f"http://127.0.0.1:{server.server_port}")
+    try:
+        client = OpenAIChatJsonClient(api_key="sk-test", model="m", base_url="http://llm.example.invalid/v1")
+        assert client.complete("hi", timeout_s=5) == '{"ok": true}'
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # A forward proxy receives the absolute target URL, so the request went via the proxy.
+    assert _ChatHandler.request_paths == ["http://llm.example.invalid/v1/chat/completions"]
+
+
+def test_payload_codec_matches_stdlib_json(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    payload = {"model": "m", "messages": [{"role": "user", "content": "酸辣湯 x2"}], "temperature": 0.0}
+    encoded = llm_client_module._dumps(payload)
+    assert json.loads(encoded) == payload
+    assert llm_client_module._loads(encoded) == payload
+
+    monkeypatch.setattr(llm_client_module, "orjson", None)
+    assert llm_client_module._dumps(payload) == json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    assert llm_client_module._loads(encoded) == payload
@@ -5,11 +5,13 @@ import sys
 from pathlib import Path
 from typing import Any
 
+import pytest
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
 from pos_norm.contracts import CandidateItem, CONTRACT_VERSION, OrderRawParsed, RawLine  # noqa: E402
+import pos_norm.llm_pipeline as llm_pipeline_module  # noqa: E402
 from pos_norm.llm_pipeline import llm_normalize_and_group  # noqa: E402
 
 
@@ -373,6 +375,21 @@ def test_reference_grouping_backstops_when_llm_misses_groups() -> None:
     assert "rule_group_backstop" in result["metadata"]["review_queue"]["reasons"]
 
 
+def test_rule_groups_accept_int_subclass_indices() -> None:
+    from enum import IntEnum
+
+    class Line(IntEnum):
+        FIRST = 0
+        SECOND = 2
+
+    groups = llm_pipeline_module._build_rule_groups(
+        [{"referenced_line_indices": [Line.SECOND, Line.FIRST, "x"]}], mark_review=False, source="test"
+    )
+
+    assert [group.line_indices for group in groups] == [[0, 2]]
+    assert all(type(idx) is int for idx in groups[0].line_indices)
+
+
 def test_missing_item_id_and_string_bool_are_safely_handled() -> None:
     order = _make_order([("鍋貼", None), ("酸辣湯", None)])
     candidates = _make_candidates(order)
@@ -489,3 +506,191 @@ def test_invalid_groups_payload_without_other_flags_still_needs_review() -> None
     assert any(event.event_type == "invalid_groups_payload" for event in result["audit_events"])
     assert result["metadata"]["review_queue"]["needs_review"] is True
     assert "invalid_groups_payload" in result["metadata"]["review_queue"]["audit_tags"]
+
+
+def test_custom_prompt_template_is_rendered_and_reloaded_after_edit(tmp_path: Path) -> None:
+    import os
+
+    prompt_file = tmp_path / "prompt.md"
+    prompt_file.write_text("v1 mods={{ALLOWED_MODS_JSON}} hints={{STEP1_HINTS_JSON}}", encoding="utf-8")
+    order = _make_order([("鍋貼", None)])
+    candidates = _make_candidates(order)
+    response = {"items": [{"line_index": 0, "item_id": "L0A", "mods": []}], "groups": []}
+
+    client = FakeLLMClient([response, response])
+    llm_normalize_and_group(
+        order, candidates, ["{{ORDER_LINES_JSON}}"], llm_client=client, prompt_path=prompt_file, compact_prompt_json=True
+    )
+    assert client.prompts[0] == 'v1 mods=["{{ORDER_LINES_JSON}}"] hints=[]'
+
+    prompt_file.write_text("v2 {{ORDER_LINES_JSON}}", encoding="utf-8")
+    stat = prompt_file.stat()
+    os.utime(prompt_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    llm_normalize_and_group(order, candidates, [], llm_client=client, prompt_path=prompt_file)
+    assert client.prompts[1].startswith("v2 [\n  {\n")
+
+
+def test_llm_calling_convention_is_remembered_per_client_function() -> None:
+    class PositionalOnlyClient:
+        def __init__(self) -> None:
+            self.prompts: list[str] = []
+
+        def invoke(self, prompt: str, /) -> dict[str, Any]:
+            self.prompts.append(prompt)
+            return {"ok": True}
+
+    first, second = PositionalOnlyClient(), PositionalOnlyClient()
+    assert llm_pipeline_module._invoke_llm(first, "p1", timeout_s=1.0) == '{"ok": true}'
+    assert llm_pipeline_module._CALL_STYLE_CACHE[PositionalOnlyClient.invoke] == 3
+    assert llm_pipeline_module._invoke_llm(second, "p2", timeout_s=1.0) == '{"ok": true}'
+    assert first.prompts == ["p1"]
+    assert second.prompts == ["p2"]
+
+    def flaky(prompt: str, timeout_s: float | None = None) -> str:
+        raise TypeError("bug inside client")
+
+    try:
+        llm_pipeline_module._invoke_llm(flaky, "p3", timeout_s=1.0)
+    except TypeError as exc:
+        assert "bug inside client" in str(exc)
+    else:  # pragma: no cover - must raise
+        raise AssertionError("TypeError from the client must propagate")
+    assert flaky not in llm_pipeline_module._CALL_STYLE_CACHE
+
+
+def test_llm_calling_convention_is_not_shared_between_partials() -> None:
+    from functools import partial
+
+    seen_timeouts: list[float | None] = []
+
+    def prompt_only(prefix: str, prompt: str) -> str:
+        return json.dumps({"prompt": prefix + prompt})
+
+    def with_timeout(prefix: str, prompt: str, timeout_s: float | None = None) -> str:
+        seen_timeouts.append(timeout_s)
+        return json.dumps({"prompt": prefix + prompt})
+
+    first, second = partial(prompt_only, ">"), partial(with_timeout, ">")
+    assert llm_pipeline_module._invoke_llm(first, "p1", timeout_s=1.0) == '{"prompt": ">p1"}'
+    assert llm_pipeline_module._invoke_llm(second, "p2", timeout_s=2.5) == '{"prompt": ">p2"}'
+    assert seen_timeouts == [2.5]
+
+
+def test_extract_json_payload_accepts_what_stdlib_json_accepts() -> None:
+    extract = llm_pipeline_module._extract_json_payload
+    assert extract('{"items": [], "groups": []}') == {"items": [], "groups": []}
+    assert extract('{"confidence": NaN, "big": 123456789012345678901234567890}')["big"] == 123456789012345678901234567890
+    assert extract('Sure! ```json\n{"items": [{"line_index": 0}]}\n``` done') == {"items": [{"line_index": 0}]}
+
+
+def test_extract_json_payload_ignores_braces_around_the_object() -> None:
+    extract = llm_pipeline_module._extract_json_payload
+    assert extract('{"items": [], "groups": []} (fill {} when unsure)') == {"items": [], "groups": []}
+    assert extract('Sure: {"items": [{"line_index": 1}]} end}') == {"items": [{"line_index": 1}]}
+    with pytest.raises(ValueError):
+        extract('{"items": [} {oops}')
+    with pytest.raises(ValueError):
+        extract('{"items": [{"line_index": 0, "item_id": "L0B"}, {"line_index": 1, "item_id": "L1')
+
+
+def test_truncated_llm_response_is_retried_not_partially_accepted() -> None:
+    order = _make_order([("鍋貼", None), ("酸辣湯", None)])
+    candidates = _make_candidates(order)
+    truncated = '{"items": [{"line_index": 0, "item_id": "L0B", "mods": []}, {"line_index": 1, "item_id": "L1'
+    response = {
+        "items": [
+            {"line_index": 0, "item_id": "L0B", "mods": []},
+            {"line_index": 1, "item_id": "L1B", "mods": []},
+        ],
+        "groups": [],
+    }
+    client = FakeLLMClient([truncated, response])
+    cache: dict[str, Any] = {}
+
+    result = llm_normalize_and_group(order, candidates, [], llm_client=client, response_cache=cache)
+
+    assert client.calls == 2
+    assert result["metadata"]["llm_attempts"] == 2
+    assert "llm_json_parse_retry" in result["metadata"]["review_queue"]["audit_tags"]
+    assert [item.item_code for item in result["items"]] == ["L0B", "L1B"]
+    assert list(cache.values()) == [response]
+
+
+def test_normalize_many_overlaps_llm_calls_and_keeps_order() -> None:
+    import threading
+
+    from pos_norm.llm_pipeline import llm_normalize_and_group_many
+
+    barrier = threading.Barrier(3, timeout=5)
+    prompts: list[str] = []
+
+    def client(prompt: str, timeout_s: float | None = None) -> str:
+        prompts.append(prompt)
+        barrier.wait()  # only passes if all three orders are in flight at once
+        return json.dumps({"items": [{"line_index": 0, "item_id": "L0B", "mods": []}], "groups": []})
+
+    orders = [_make_order([(name, None)]) for name in ("鍋貼", "酸辣湯", "豆漿")]
+    results = llm_normalize_and_group_many(
+        [(order, _make_candidates(order)) for order in orders],
+        [],
+        llm_client=client,
+        compact_prompt_json=True,
+        max_concurrency=3,
+    )
+
+    assert [result["items"][0].name_raw for result in results] == ["鍋貼", "酸辣湯", "豆漿"]
+    assert len(prompts) == 3 and all('[{"line_index":0,' in prompt for prompt in prompts)
+    assert all(result["metadata"]["fallback_reason"] is None for result in results)
+
+
+def test_response_cache_skips_llm_for_identical_prompt() -> None:
+    order = _make_order([("鍋貼", None)])
+    candidates = _make_candidates(order)
+    response = {"items": [{"line_index": 0, "item_id": "L0B", "mods": []}], "groups": []}
+    client = FakeLLMClient([response])
+    cache: dict[str, Any] = {}
+
+    first = llm_normalize_and_group(order, candidates, ["加辣"], llm_client=client, response_cache=cache)
+    second = llm_normalize_and_group(order, candidates, ["加辣"], llm_client=client, response_cache=cache)
+    third = llm_normalize_and_group(order, candidates, ["去蔥"], llm_client=client, response_cache=cache)
+
+    assert client.calls == 2
+    assert first["metadata"]["llm_cache_hit"] is False
+    assert second["metadata"]["llm_cache_hit"] is True
+    assert second["metadata"]["llm_attempts"] == 0
+    assert second["items"][0].item_code == first["items"][0].item_code == "L0B"
+    assert third["metadata"]["fallback_reason"] == "llm_api_error"
+    assert len(cache) == 1
+    assert "llm_cache_hit" in second["metadata"]["review_queue"]["audit_tags"]
+    assert second["metadata"]["review_queue"]["needs_review"] is False
+
+
+def test_response_cache_key_ignores_whitespace_differences() -> None:
+    order = _make_order([("鍋貼", "加辣")])
+    spaced = _make_order([("鍋貼", "加辣")])
+    spaced.lines[0].raw_line = "鍋貼   x1  備註:加辣"
+    response = {"items": [{"line_index": 0, "item_id": "L0B", "mods": []}], "groups": []}
+    client = FakeLLMClient([response])
+    cache: dict[str, Any] = {}
+
+    llm_normalize_and_group(order, _make_candidates(order), [], llm_client=client, response_cache=cache)
+    second = llm_normalize_and_group(spaced, _make_candidates(spaced), [], llm_client=client, response_cache=cache)
+
+    assert client.calls == 1
+    assert second["metadata"]["llm_cache_hit"] is True
+
+
+def test_response_cache_is_bypassed_for_sampling_clients() -> None:
+    order = _make_order([("鍋貼", None)])
+    candidates = _make_candidates(order)
+    response = {"items": [{"line_index": 0, "item_id": "L0B", "mods": []}], "groups": []}
+    client = FakeLLMClient([response, response])
+    client.temperature = 0.7
+    cache: dict[str, Any] = {}
+
+    llm_normalize_and_group(order, candidates, [], llm_client=client, response_cache=cache)
+    second = llm_normalize_and_group(order, candidates, [], llm_client=client, response_cache=cache)
+
+    assert client.calls == 2
+    assert second["metadata"]["llm_cache_hit"] is False
+    assert cache == {}
@@ -490,3 +490,25 @@ def test_group_invalid_shape_or_too_few_lines_marks_review() -> None:
     assert any(event.event_type == "group_line_indices_invalid_shape" for event in result.audit_events)
     assert any(event.event_type == "group_too_few_lines" for event in result.audit_events)
     _assert_raw_fields_preserved(result, order)
+
+
+def test_non_contiguous_line_indices_are_validated_by_membership() -> None:
+    order = _make_order()
+    order.lines[1].line_index = 5
+    candidates = _make_candidates(order)
+    structured = _structured(
+        items=[
+            _item(line_index=0, item_code="I001", name_normalized="招牌鍋貼", qty=2),
+            _item(line_index=1, item_code="I002", name_normalized="酸辣湯", qty=1),
+            _item(line_index=5, item_code="I002", name_normalized="酸辣湯", qty=1),
+        ],
+        groups=[_group(group_id="G1", line_indices=[0, 1, 5])],
+    )
+
+    result = merge_and_validate(order, candidates, structured, menu_catalog=MENU_CATALOG, allowed_mods=ALLOWED_MODS)
+
+    assert [item.line_index for item in result.items] == [0, 5]
+    assert result.items[1].metadata["merge_source"] == "llm"
+    assert result.groups[0].line_indices == [0, 5]
+    assert any(event.event_type == "item_invalid_line_index" for event in result.audit_events)
+    assert any(event.event_type == "group_line_index_out_of_range" for event in result.audit_events)